@@ -535,6 +535,44 @@ def show_dashboard():
         recent_attendance = attendance_df.tail(10)
         st.dataframe(recent_attendance)
 
+@st.fragment
+def show_employee_list():
+    """Show the filterable employee list"""
+    employees_df = data_manager.load_employees()
+    
+    if not employees_df.empty:
+        # Filters
+        col1, col2 = st.columns(2)
+        with col1:
+            dept_filter = st.selectbox("Filter by Department", 
+                                     ["All"] + list(employees_df['department'].unique()))
+        with col2:
+            search = st.text_input("Search by Name or ID")
+        
+        # Apply filters as one combined mask
+        mask = pd.Series(True, index=employees_df.index)
+        if dept_filter != "All":
+            mask &= employees_df['department'].eq(dept_filter)
+        if search:
+            search_text = data_manager.load_employee_search_text()
+            mask &= search_text.str.contains(search.lower(), regex=False, na=False)
+        filtered_df = employees_df.loc[mask]
+        
+        st.dataframe(filtered_df, use_container_width=True)
+        
+        # Employee details
+        if st.checkbox("Show Employee Details"):
+            selected_id = st.selectbox("Select Employee", filtered_df['employee_id'].tolist())
+            if selected_id:
+                employee = filtered_df[filtered_df['employee_id'] == selected_id].iloc[0]
+                st.write(f"**Name:** {employee['name']}")
+                st.write(f"**Department:** {employee['department']}")
+                st.write(f"**Role:** {employee['role']}")
+                st.write(f"**Email:** {employee['email']}")
+                st.write(f"**Hire Date:** {employee['hire_date']}")
+    else:
+        st.info("No employees found. Add employees using the tabs above.")
+
 def show_employee_management():
     st.header("👥 Employee Management")
     
@@ -554,41 +592,7 @@ def show_employee_management():
     
     with tab1:
         st.subheader("Employee List")
-        employees_df = data_manager.load_employees()
-        
-        if not employees_df.empty:
-            # Filters
-            col1, col2 = st.columns(2)
-            with col1:
-                dept_filter = st.selectbox("Filter by Department", 
-                                         ["All"] + list(employees_df['department'].unique()))
-            with col2:
-                search = st.text_input("Search by Name or ID")
-            
-            # Apply filters
-            filtered_df = employees_df.copy()
-            if dept_filter != "All":
-                filtered_df = filtered_df[filtered_df['department'] == dept_filter]
-            if search:
-                filtered_df = filtered_df[
-                    filtered_df['name'].str.contains(search, case=False) |
-                    filtered_df['employee_id'].str.contains(search, case=False)
-                ]
-            
-            st.dataframe(filtered_df, use_container_width=True)
-            
-            # Employee details
-            if st.checkbox("Show Employee Details"):
-                selected_id = st.selectbox("Select Employee", filtered_df['employee_id'].tolist())
-                if selected_id:
-                    employee = filtered_df[filtered_df['employee_id'] == selected_id].iloc[0]
-                    st.write(f"**Name:** {employee['name']}")
-                    st.write(f"**Department:** {employee['department']}")
-                    st.write(f"**Role:** {employee['role']}")
-                    st.write(f"**Email:** {employee['email']}")
-                    st.write(f"**Hire Date:** {employee['hire_date']}")
-        else:
-            st.info("No employees found. Add employees using the tabs above.")
+        show_employee_list()
     
     with tab2:
         st.subheader("Add New Employee")
@@ -664,6 +668,48 @@ def show_employee_management():
             except Exception as e:
                 st.error(f"Error reading file: {e}")
 
+@st.fragment
+def show_attendance_records():
+    """Show the filterable attendance records"""
+    
+    attendance_df = data_manager.load_attendance()
+    if not attendance_df.empty:
+        employees_df = data_manager.load_employees()
+        
+        # Filters
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            start_date = st.date_input("Start Date", 
+                                     datetime.now().date().replace(day=1))
+        with col2:
+            end_date = st.date_input("End Date", datetime.now().date())
+        with col3:
+            dept_filter = st.selectbox("Department", 
+                                     ["All"] + list(employees_df['department'].unique()))
+        
+        # Apply filters as one combined mask
+        attendance_df['date'] = pd.to_datetime(attendance_df['date'])
+        record_dates = attendance_df['date'].dt.date
+        mask = (record_dates >= start_date) & (record_dates <= end_date)
+        
+        if dept_filter != "All":
+            employee_ids = employees_df.loc[employees_df['department'].eq(dept_filter), 'employee_id']
+            mask &= attendance_df['employee_id'].isin(employee_ids)
+        
+        filtered_attendance = attendance_df.loc[mask]
+        
+        st.dataframe(filtered_attendance, use_container_width=True)
+        
+        # Attendance statistics
+        if not filtered_attendance.empty:
+            total_records = len(filtered_attendance)
+            present_records = len(filtered_attendance[filtered_attendance['status'] == 'Present'])
+            attendance_rate = (present_records / total_records) * 100
+            
+            st.metric("Attendance Rate", f"{attendance_rate:.1f}%")
+    else:
+        st.info("No attendance records found.")
+
 def show_attendance():
     st.header("📋 Attendance Management")
     
@@ -713,48 +759,7 @@ def show_attendance():
     
     with tab2:
         st.subheader("Attendance Records")
-        
-        attendance_df = data_manager.load_attendance()
-        if not attendance_df.empty:
-            # Filters
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                start_date = st.date_input("Start Date", 
-                                         datetime.now().date().replace(day=1))
-            with col2:
-                end_date = st.date_input("End Date", datetime.now().date())
-            with col3:
-                dept_filter = st.selectbox("Department", 
-                                         ["All"] + list(data_manager.load_employees()['department'].unique()))
-            
-            # Apply filters
-            filtered_attendance = attendance_df.copy()
-            filtered_attendance['date'] = pd.to_datetime(filtered_attendance['date'])
-            
-            filtered_attendance = filtered_attendance[
-                (filtered_attendance['date'].dt.date >= start_date) &
-                (filtered_attendance['date'].dt.date <= end_date)
-            ]
-            
-            if dept_filter != "All":
-                employee_ids = data_manager.load_employees()[
-                    data_manager.load_employees()['department'] == dept_filter
-                ]['employee_id'].tolist()
-                filtered_attendance = filtered_attendance[
-                    filtered_attendance['employee_id'].isin(employee_ids)
-                ]
-            
-            st.dataframe(filtered_attendance, use_container_width=True)
-            
-            # Attendance statistics
-            if not filtered_attendance.empty:
-                total_records = len(filtered_attendance)
-                present_records = len(filtered_attendance[filtered_attendance['status'] == 'Present'])
-                attendance_rate = (present_records / total_records) * 100
-                
-                st.metric("Attendance Rate", f"{attendance_rate:.1f}%")
-        else:
-            st.info("No attendance records found.")
+        show_attendance_records()
     
     with tab3:
         show_face_recognition()
@@ -825,6 +830,29 @@ def show_face_recognition():
                 else:
                     st.error("No faces recognized")
 
+@st.fragment
+def show_performance_records():
+    """Show the filterable performance records"""
+    
+    performance_df = data_manager.load_performance()
+    if not performance_df.empty:
+        # Filters
+        col1, col2 = st.columns(2)
+        with col1:
+            start_date = st.date_input("Start Date", 
+                                     datetime.now().date().replace(day=1), key="perf_start")
+        with col2:
+            end_date = st.date_input("End Date", datetime.now().date(), key="perf_end")
+        
+        # Apply filters
+        performance_df['date'] = pd.to_datetime(performance_df['date'])
+        record_dates = performance_df['date'].dt.date
+        filtered_performance = performance_df.loc[(record_dates >= start_date) & (record_dates <= end_date)]
+        
+        st.dataframe(filtered_performance, use_container_width=True)
+    else:
+        st.info("No performance records found.")
+
 def show_performance_tracking():
     st.header("📈 Performance Tracking")
     
@@ -881,29 +909,7 @@ def show_performance_tracking():
     
     with tab2:
         st.subheader("Performance Records")
-        
-        performance_df = data_manager.load_performance()
-        if not performance_df.empty:
-            # Filters
-            col1, col2 = st.columns(2)
-            with col1:
-                start_date = st.date_input("Start Date", 
-                                         datetime.now().date().replace(day=1), key="perf_start")
-            with col2:
-                end_date = st.date_input("End Date", datetime.now().date(), key="perf_end")
-            
-            # Apply filters
-            filtered_performance = performance_df.copy()
-            filtered_performance['date'] = pd.to_datetime(filtered_performance['date'])
-            
-            filtered_performance = filtered_performance[
-                (filtered_performance['date'].dt.date >= start_date) &
-                (filtered_performance['date'].dt.date <= end_date)
-            ]
-            
-            st.dataframe(filtered_performance, use_container_width=True)
-        else:
-            st.info("No performance records found.")
+        show_performance_records()
     
     with tab3:
         st.subheader("Productivity Analysis")
@@ -4,6 +4,29 @@ import os
 from datetime import datetime
 import streamlit as st
 
+# Column types applied while parsing each CSV, so these columns skip type inference;
+# low-cardinality columns only used for equality filters and grouping load as categories
+EMPLOYEE_DTYPES = {
+    'employee_id': str, 'name': str, 'email': str, 'department': 'category',
+    'role': 'category', 'phone': str, 'address': str
+}
+ATTENDANCE_DTYPES = {'employee_id': str, 'date': str, 'time_in': str, 'time_out': str, 'status': 'category'}
+PERFORMANCE_DTYPES = {
+    'employee_id': str, 'date': str, 'quality_score': 'float64',
+    'productivity_score': 'float64', 'comments': str
+}
+
+@st.cache_data(show_spinner=False)
+def read_csv_cached(file_path, modified_ns, dtypes=None):
+    """Read a CSV file, reusing the parsed frame until its modification time changes"""
+    return pd.read_csv(file_path, dtype=dtypes)
+
+@st.cache_data(show_spinner=False)
+def build_employee_search_text(file_path, modified_ns):
+    """Build one lowercase name and id search string per employee row"""
+    employees_df = read_csv_cached(file_path, modified_ns, EMPLOYEE_DTYPES)
+    return employees_df['name'].astype(str).str.lower() + "\x00" + employees_df['employee_id'].astype(str).str.lower()
+
 class DataManager:
     def __init__(self, data_dir="data"):
         self.data_dir = data_dir
@@ -43,15 +66,19 @@ class DataManager:
     def load_employees(self):
         """Load employees data"""
         try:
-            return pd.read_csv(self.employees_file)
+            return read_csv_cached(self.employees_file, os.stat(self.employees_file).st_mtime_ns, EMPLOYEE_DTYPES)
         except Exception as e:
             st.error(f"Error loading employees data: {e}")
             return pd.DataFrame()
     
+    def load_employee_search_text(self):
+        """Load lowercase search strings aligned with the rows of load_employees"""
+        return build_employee_search_text(self.employees_file, os.stat(self.employees_file).st_mtime_ns)
+    
     def load_attendance(self):
         """Load attendance data"""
         try:
-            return pd.read_csv(self.attendance_file)
+            return read_csv_cached(self.attendance_file, os.stat(self.attendance_file).st_mtime_ns, ATTENDANCE_DTYPES)
         except Exception as e:
             st.error(f"Error loading attendance data: {e}")
             return pd.DataFrame()
@@ -59,7 +86,7 @@ class DataManager:
     def load_performance(self):
         """Load performance data"""
         try:
-            return pd.read_csv(self.performance_file)
+            return read_csv_cached(self.performance_file, os.stat(self.performance_file).st_mtime_ns, PERFORMANCE_DTYPES)
         except Exception as e:
             st.error(f"Error loading performance data: {e}")
             return pd.DataFrame()
@@ -117,9 +144,11 @@ class DataManager:
         if len(employee_index) == 0:
             return False, "Employee not found"
         
-        # Update employee data
+        # Update employee data, widening categorical columns that may receive a new value
         for key, value in employee_data.items():
             if key in employees_df.columns:
+                if isinstance(employees_df[key].dtype, pd.CategoricalDtype):
+                    employees_df[key] = employees_df[key].astype(object)
                 employees_df.loc[employee_index[0], key] = value
         
         if self.save_employees(employees_df):
@@ -231,7 +260,7 @@ class DataManager:
         merged_df = merged_df.merge(performance_df, on=['employee_id', 'date'], how='left')
         
         # Group by department
-        dept_stats = merged_df.groupby('department').agg({
+        dept_stats = merged_df.groupby('department', observed=True).agg({
             'employee_id': 'count',
             'status': lambda x: (x == 'Present').sum() / len(x) * 100 if len(x) > 0 else 0,
             'tasks_completed': 'mean',
@@ -29,15 +29,15 @@ class AlertSystem:
                                             on='employee_id', how='left')
         
         alerts = []
-        for _, row in low_attendance.iterrows():
+        for row in low_attendance.itertuples(index=False):
             alerts.append({
                 'type': 'Low Attendance',
-                'employee_id': row['employee_id'],
-                'employee_name': row['name'],
-                'department': row['department'],
-                'value': f"{row['attendance_rate']:.1f}%",
+                'employee_id': row.employee_id,
+                'employee_name': row.name,
+                'department': row.department,
+                'value': f"{row.attendance_rate:.1f}%",
                 'threshold': f"{threshold}%",
-                'severity': 'warning' if row['attendance_rate'] > 70 else 'danger'
+                'severity': 'warning' if row.attendance_rate > 70 else 'danger'
             })
         
         return alerts
@@ -78,15 +78,15 @@ class AlertSystem:
                                              on='employee_id', how='left')
         
         alerts = []
-        for _, row in low_performance.iterrows():
+        for row in low_performance.itertuples(index=False):
             alerts.append({
                 'type': 'Performance Dip',
-                'employee_id': row['employee_id'],
-                'employee_name': row['name'],
-                'department': row['department'],
-                'value': f"{row['overall_score']:.1f}",
+                'employee_id': row.employee_id,
+                'employee_name': row.name,
+                'department': row.department,
+                'value': f"{row.overall_score:.1f}",
                 'threshold': f"{threshold}",
-                'severity': 'warning' if row['overall_score'] > 60 else 'danger'
+                'severity': 'warning' if row.overall_score > 60 else 'danger'
             })
         
         return alerts
@@ -114,15 +114,15 @@ class AlertSystem:
                                       on='employee_id', how='left')
         
         alerts = []
-        for _, row in no_activity.iterrows():
+        for row in no_activity.itertuples(index=False):
             alerts.append({
                 'type': 'No Recent Activity',
-                'employee_id': row['employee_id'],
-                'employee_name': row['name'],
-                'department': row['department'],
-                'value': f"{row['days_since']} days",
+                'employee_id': row.employee_id,
+                'employee_name': row.name,
+                'department': row.department,
+                'value': f"{row.days_since} days",
                 'threshold': f"{days_threshold} days",
-                'severity': 'warning' if row['days_since'] <= 14 else 'danger'
+                'severity': 'warning' if row.days_since <= 14 else 'danger'
             })
         
         return alerts
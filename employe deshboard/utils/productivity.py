@@ -50,12 +50,10 @@ class ProductivityAnalyzer:
             return None, "No data for specified period"
         
         # Calculate productivity scores
-        performance_df['productivity_score'] = performance_df.apply(
-            lambda row: self.calculate_productivity_score(
-                row['tasks_completed'], 
-                row['quality_score']
-            ), axis=1
-        )
+        performance_df['productivity_score'] = [
+            self.calculate_productivity_score(tasks_completed, quality_score)
+            for tasks_completed, quality_score in performance_df[['tasks_completed', 'quality_score']].itertuples(index=False, name=None)
+        ]
         
         # Group by date for trend analysis
         daily_trends = performance_df.groupby('date').agg({
@@ -130,12 +128,10 @@ class ProductivityAnalyzer:
             comparison_group = merged_df
         
         # Calculate average productivity scores
-        comparison_group['productivity_score'] = comparison_group.apply(
-            lambda row: self.calculate_productivity_score(
-                row['tasks_completed'], 
-                row['quality_score']
-            ), axis=1
-        )
+        comparison_group['productivity_score'] = [
+            self.calculate_productivity_score(tasks_completed, quality_score)
+            for tasks_completed, quality_score in comparison_group[['tasks_completed', 'quality_score']].itertuples(index=False, name=None)
+        ]
         
         # Group by employee
         employee_averages = comparison_group.groupby('employee_id').agg({
@@ -184,12 +180,10 @@ class ProductivityAnalyzer:
             ]
         
         # Calculate productivity scores
-        performance_df['productivity_score'] = performance_df.apply(
-            lambda row: self.calculate_productivity_score(
-                row['tasks_completed'], 
-                row['quality_score']
-            ), axis=1
-        )
+        performance_df['productivity_score'] = [
+            self.calculate_productivity_score(tasks_completed, quality_score)
+            for tasks_completed, quality_score in performance_df[['tasks_completed', 'quality_score']].itertuples(index=False, name=None)
+        ]
         
         # Add day of week and month
         performance_df['date'] = pd.to_datetime(performance_df['date'])
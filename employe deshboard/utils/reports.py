@@ -72,8 +72,8 @@ class ReportGenerator:
         attendance_df = self.data_manager.load_attendance()
         performance_df = self.data_manager.load_performance()
         
-        # Filter by department employees
-        dept_employee_ids = dept_employees['employee_id'].tolist()
+        # Filter by department employees, sharing one id array between both lookups
+        dept_employee_ids = dept_employees['employee_id'].unique()
         dept_attendance = attendance_df[attendance_df['employee_id'].isin(dept_employee_ids)]
         dept_performance = performance_df[performance_df['employee_id'].isin(dept_employee_ids)]
         
@@ -9,10 +9,12 @@ import base64
 from datetime import datetime
 from app.database import get_db_connection, init_db
 from app.face_engine import extract_embedding, get_best_match
-from app.attendance_engine import check_in, check_out, get_today_attendance
+from app.attendance_engine import check_in, check_out, get_today_attendance, get_attendance_logs, get_department_attendance
 from app.security import encrypt_embedding, decrypt_embedding, log_event
 
 # Configuration
+LOGS_PER_PAGE = 50
+ADMIN_VIEWS = ["Employee Records", "Full Attendance Logs", "Usage Visuals"]
 BG_IMAGE_PATH = r"C:\Users\himanshu bagoria\.gemini\antigravity\brain\4fe4773c-4ff7-4fe6-bf05-134a6e3cbf4a\software_dev_company_bg_1773732124524.png"
 
 # Set page config
@@ -160,17 +162,15 @@ def show_dashboard():
     df = get_today_attendance()
     
     m1, m2, m3 = st.columns(3)
-    m1.metric("Live Present", len(df['name'].unique()))
-    m2.metric("Active Sessions", len(df[df['check_out'].isna()]))
+    m1.metric("Live Present", df['name'].nunique())
+    m2.metric("Active Sessions", int(df['check_out'].isna().sum()))
     m3.metric("Daily Avg (hrs)", round(df['duration'].mean(), 2) if not df.empty else 0)
 
     if not df.empty:
         c1, c2 = st.columns([2, 1])
         with c1:
             st.markdown("#### Today's Activity")
-            # Formatting DF for display
-            display_df = df.copy()
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(df, use_container_width=True)
         with c2:
             fig = px.pie(df, names='category', hole=.4, 
                          color_discrete_sequence=px.colors.qualitative.Pastel)
@@ -237,11 +237,11 @@ def show_mark_attendance():
         return
 
     user_profiles = []
-    for _, r in users_df.iterrows():
+    for r in users_df.itertuples(index=False):
         try:
-            emb = decrypt_embedding(r['embedding'])
+            emb = decrypt_embedding(r.embedding)
             if emb is not None:
-                user_profiles.append({'id': r['id'], 'name': r['name'], 'embedding': emb})
+                user_profiles.append({'id': r.id, 'name': r.name, 'embedding': emb})
         except Exception:
             pass  # Skip corrupted embeddings silently
 
@@ -278,45 +278,56 @@ def show_mark_attendance():
 
 def show_admin_panel():
     st.subheader("🛡️ Strategic Admin Portal")
-    admin_tab1, admin_tab2, admin_tab3 = st.tabs(["Employee Records", "Full Attendance Logs", "Usage Visuals"])
     
-    conn = get_db_connection()
+    # Only the selected view runs its queries, unlike tabs which execute every body on each rerun
+    admin_view = st.segmented_control(
+        "Admin View",
+        ADMIN_VIEWS,
+        default=ADMIN_VIEWS[0],
+        key="admin_view",
+        label_visibility="collapsed"
+    )
     
-    with admin_tab1:
+    if admin_view == "Employee Records":
         st.write("#### Master Employee List")
+        conn = get_db_connection()
         users_raw = pd.read_sql_query("SELECT id, employee_id, name, age, department, role, created_at, is_active FROM Users", conn)
+        conn.close()
         st.dataframe(users_raw, use_container_width=True)
         
         # Proper CSV formatting for download
         csv_users = users_raw.to_csv(index=False).encode('utf-8')
         st.download_button("📥 Download Employee Master CSV", csv_users, "employee_records.csv", "text/csv")
         
-    with admin_tab2:
+    elif admin_view == "Full Attendance Logs":
         st.write("#### Detailed Attendance History")
-        attendance_raw = pd.read_sql_query("""
-            SELECT u.employee_id, u.name, u.department, a.check_in, a.check_out, a.duration, a.category 
-            FROM Attendance a 
-            JOIN Users u ON a.user_id = u.id
-            ORDER BY a.check_in DESC
-        """, conn)
-        st.dataframe(attendance_raw, use_container_width=True)
+        f1, f2, f3 = st.columns(3)
+        employee_filter = f1.text_input("Employee ID") or None
+        date_filter = f2.date_input("From Date", value=None)
+        page = f3.number_input("Page", min_value=1, value=1, step=1)
+        date_from = date_filter.isoformat() if date_filter else None
+        
+        # Filters and paging run in SQL so only one page of logs is loaded
+        attendance_page = get_attendance_logs(employee_filter, date_from,
+                                              limit=LOGS_PER_PAGE, offset=(page - 1) * LOGS_PER_PAGE)
+        st.dataframe(attendance_page, use_container_width=True)
         
         # Proper CSV formatting for download
-        csv_att = attendance_raw.to_csv(index=False).encode('utf-8')
-        st.download_button("📥 Download Attendance Logs CSV", csv_att, "attendance_logs.csv", "text/csv")
+        if st.button("📦 Prepare Attendance Logs CSV"):
+            csv_att = get_attendance_logs(employee_filter, date_from).to_csv(index=False).encode('utf-8')
+            st.download_button("📥 Download Attendance Logs CSV", csv_att, "attendance_logs.csv", "text/csv")
         
-    with admin_tab3:
+    elif admin_view == "Usage Visuals":
         st.write("#### Department-wise Attendance Distribution")
-        if not attendance_raw.empty:
-            fig_dept = px.bar(attendance_raw, x="department", color="category", barmode="group",
+        dept_counts = get_department_attendance()
+        if not dept_counts.empty:
+            fig_dept = px.bar(dept_counts, x="department", y="count", color="category", barmode="group",
                              title="Attendance Category by Department",
                              color_discrete_sequence=px.colors.qualitative.Vivid)
             fig_dept.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font_color="white")
             st.plotly_chart(fig_dept, use_container_width=True)
         else:
             st.info("Insufficient data for visualization.")
-            
-    conn.close()
 
 if __name__ == "__main__":
     main()
@@ -85,6 +85,35 @@ def check_out(user_id):
     conn.close()
     return True, f"Check-out successful. Category: {category}. Duration: {round(duration, 2)} hrs."
 
+def get_attendance_logs(employee_id=None, date_from=None, limit=None, offset=0):
+    conn = get_db_connection()
+    query = '''
+        SELECT u.employee_id, u.name, u.department, a.check_in, a.check_out, a.duration, a.category 
+        FROM Attendance a 
+        JOIN Users u ON a.user_id = u.id
+        WHERE (? IS NULL OR u.employee_id = ?) 
+        AND (? IS NULL OR a.check_in >= ?)
+        ORDER BY a.check_in DESC
+    '''
+    params = [employee_id, employee_id, date_from, date_from]
+    if limit is not None:
+        query += " LIMIT ? OFFSET ?"
+        params += [limit, offset]
+    df = pd.read_sql_query(query, conn, params=params)
+    conn.close()
+    return df
+
+def get_department_attendance():
+    conn = get_db_connection()
+    df = pd.read_sql_query('''
+        SELECT u.department, a.category, COUNT(*) AS count 
+        FROM Attendance a 
+        JOIN Users u ON a.user_id = u.id
+        GROUP BY u.department, a.category
+    ''', conn)
+    conn.close()
+    return df
+
 def get_today_attendance():
     conn = get_db_connection()
     df = pd.read_sql_query('''
@@ -47,6 +47,10 @@ def init_db():
         )
     ''')
     
+    # Attendance lookups filter by user and order by check-in time
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_attendance_user_checkin ON Attendance(user_id, check_in DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_attendance_checkin ON Attendance(check_in DESC)")
+    
     # Usage logs for rules (e.g., half-day tracking)
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS UsageLogs (
@@ -1,5 +1,7 @@
 # Theme configurations for Smart Hospital System
 
+from functools import lru_cache
+
 # Light theme
 LIGHT_THEME = {
     "primary_color": "#667eea",
@@ -60,18 +62,21 @@ MEDICAL_THEME = {
     "info_color": "#3498db"
 }
 
+# Theme lookup by name
+THEMES = {
+    "light": LIGHT_THEME,
+    "dark": DARK_THEME,
+    "futuristic": FUTURISTIC_THEME,
+    "medical": MEDICAL_THEME
+}
+
 # Get theme by name
 def get_theme(theme_name):
     """Get theme configuration by name"""
-    themes = {
-        "light": LIGHT_THEME,
-        "dark": DARK_THEME,
-        "futuristic": FUTURISTIC_THEME,
-        "medical": MEDICAL_THEME
-    }
-    return themes.get(theme_name.lower(), LIGHT_THEME)
+    return THEMES.get(theme_name.lower(), LIGHT_THEME)
 
-# Apply theme to CSS
+# Apply theme to CSS; the stylesheet only depends on the theme name, so build it once per name
+@lru_cache(maxsize=None)
 def get_theme_css(theme_name):
     """Get CSS for a specific theme"""
     theme = get_theme(theme_name)
@@ -12,7 +12,7 @@ try:
     from utils.ui_components import *
     from utils.auth import *
     from utils.database import *
-    from utils.data_manager import data_manager
+    from utils.data_manager import data_manager, load_cached_data
     from utils.token_manager import token_manager
     from config.themes import *
 except ImportError as e:
@@ -316,6 +316,34 @@ def show_home_dashboard():
     - Comprehensive data management and export
     """)
 
+# Saved records rendered per page in each module's record list
+RECORDS_PER_PAGE = 20
+
+def paginate_records(records, key):
+    """Return one page of records, with a page picker once there are more than RECORDS_PER_PAGE"""
+    if len(records) <= RECORDS_PER_PAGE:
+        return records
+    
+    pages = -(-len(records) // RECORDS_PER_PAGE)
+    page = st.number_input(f"Page (1-{pages})", min_value=1, max_value=pages, value=1, key=f"{key}_page")
+    start = (page - 1) * RECORDS_PER_PAGE
+    return records[start:start + RECORDS_PER_PAGE]
+
+# Alert box styles for status values shown in the saved-record lists
+TOKEN_PRIORITY_STYLES = {"Emergency": "error", "High": "warning"}
+LAB_RESULT_STYLES = {"Normal": "success", "Abnormal": "warning", "Critical": "error"}
+EMERGENCY_SEVERITY_STYLES = {"Critical": "error", "High": "warning"}
+PAYMENT_STATUS_STYLES = {"Paid": "success", "Pending": "info"}
+DOCTOR_AVAILABILITY_STYLES = {"Available": "success", "Limited": "warning"}
+WARD_STATUS_STYLES = {"Discharged": "success", "Ready for Discharge": "info"}
+
+# Star strings for doctor ratings, indexed by the integer rating
+RATING_STARS = tuple("⭐" * rating for rating in range(6))
+
+def show_status(value, styles, default="info"):
+    """Show a status value in the alert box style mapped to it"""
+    getattr(st, styles.get(value, default))(value)
+
 def show_module_content(module_name):
     """Display content for each module"""
     st.markdown(f"""
@@ -384,12 +412,7 @@ def show_module_content(module_name):
                         st.write(f"**{token['token_number']}** - {token['patient_name']}")
                         st.write(f"Dept: {token['department']} | ID: {token['token_id']}")
                     with col2:
-                        if token['priority'] == "Emergency":
-                            st.error(token['priority'])
-                        elif token['priority'] == "High":
-                            st.warning(token['priority'])
-                        else:
-                            st.info(token['priority'])
+                        show_status(token['priority'], TOKEN_PRIORITY_STYLES)
                     with col3:
                         st.write(f"{token['estimated_wait_minutes']} min")
                     with col4:
@@ -459,9 +482,9 @@ def show_module_content(module_name):
         
         # View saved authentication records
         st.markdown("### 📋 Saved Authentication Records")
-        auth_records = data_manager.load_data("authentication")
+        auth_records = load_cached_data("authentication")
         if auth_records:
-            for i, record in enumerate(auth_records):
+            for i, record in enumerate(paginate_records(auth_records, "authentication")):
                 try:
                     with st.container():
                         col1, col2, col3 = st.columns([3, 1, 1])
@@ -471,9 +494,8 @@ def show_module_content(module_name):
                             notes = record.get('notes', '')
                             timestamp = record.get('timestamp', '')[:10] if record.get('timestamp') else 'Unknown'
                             
-                            st.write(f"**{patient_name}** - {auth_method}")
-                            st.write(f"Notes: {notes}")
-                            st.write(f"Date: {timestamp}")
+                            details = [f"**{patient_name}** - {auth_method}", f"Notes: {notes}", f"Date: {timestamp}"]
+                            st.markdown("\n\n".join(details))
                         with col2:
                             status = record.get('status', 'Unknown')
                             st.success(status)
@@ -514,19 +536,19 @@ def show_module_content(module_name):
         
         # View saved symptom analyses
         st.markdown("### 📋 Saved Symptom Analyses")
-        symptom_records = data_manager.load_data("symptoms")
+        symptom_records = load_cached_data("symptoms")
         if symptom_records:
-            for record in symptom_records:
+            for record in paginate_records(symptom_records, "symptom"):
                 with st.container():
                     col1, col2 = st.columns([4, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['severity']}")
-                        st.write(f"Symptoms: {', '.join(record['symptoms'])}")
+                        details = [f"**{record['patient_name']}** - {record['severity']}", f"Symptoms: {', '.join(record['symptoms'])}"]
                         if record['diagnosis']:
-                            st.write(f"Diagnosis: {record['diagnosis']}")
+                            details.append(f"Diagnosis: {record['diagnosis']}")
                         if record['treatment']:
-                            st.write(f"Treatment: {record['treatment']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Treatment: {record['treatment']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         if st.button("🗑️", key=f"del_symptom_{record['id']}"):
                             data_manager.delete_data("symptoms", record['id'])
@@ -563,16 +585,16 @@ def show_module_content(module_name):
         
         # View saved appointments
         st.markdown("### 📋 Saved Appointments")
-        appointment_records = data_manager.load_data("appointments")
+        appointment_records = load_cached_data("appointments")
         if appointment_records:
-            for record in appointment_records:
+            for record in paginate_records(appointment_records, "appointment"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['doctor']}")
-                        st.write(f"Date: {record['date']} at {record['time']}")
+                        details = [f"**{record['patient_name']}** - {record['doctor']}", f"Date: {record['date']} at {record['time']}"]
                         if record['reason']:
-                            st.write(f"Reason: {record['reason']}")
+                            details.append(f"Reason: {record['reason']}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         st.info(record['status'])
                     with col3:
@@ -604,7 +626,8 @@ def show_module_content(module_name):
                     health_data = {
                         "patient_name": patient_name,
                         "heart_rate": heart_rate,
-                        "blood_pressure": f"{blood_pressure_sys}/{blood_pressure_dia}",
+                        "blood_pressure_systolic": blood_pressure_sys,
+                        "blood_pressure_diastolic": blood_pressure_dia,
                         "temperature": temperature,
                         "notes": notes
                     }
@@ -616,20 +639,24 @@ def show_module_content(module_name):
         
         # View saved health metrics
         st.markdown("### 📋 Saved Health Metrics")
-        health_records = data_manager.load_data("health_metrics")
+        health_records = load_cached_data("health_metrics")
         if health_records:
-            for record in health_records:
+            for record in paginate_records(health_records, "health"):
                 with st.container():
                     col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}**")
+                        details = [f"**{record['patient_name']}**"]
                         if record['notes']:
-                            st.write(f"Notes: {record['notes']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Notes: {record['notes']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         st.metric("Heart Rate", f"{record['heart_rate']} BPM")
                     with col3:
-                        st.metric("Blood Pressure", record['blood_pressure'])
+                        if 'blood_pressure_systolic' in record:
+                            st.metric("Blood Pressure", f"{record['blood_pressure_systolic']}/{record['blood_pressure_diastolic']}")
+                        else:
+                            st.metric("Blood Pressure", record['blood_pressure'])
                     with col4:
                         st.metric("Temperature", f"{record['temperature']}°F")
                         if st.button("🗑️", key=f"del_health_{record['id']}"):
@@ -669,18 +696,17 @@ def show_module_content(module_name):
         
         # View saved prescriptions
         st.markdown("### 📋 Saved Prescriptions")
-        prescription_records = data_manager.load_data("prescriptions")
+        prescription_records = load_cached_data("prescriptions")
         if prescription_records:
-            for record in prescription_records:
+            for record in paginate_records(prescription_records, "prescription"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['medicine_name']}")
-                        st.write(f"Dosage: {record['dosage']} - {record['frequency']}")
-                        st.write(f"Duration: {record['duration']}")
+                        details = [f"**{record['patient_name']}** - {record['medicine_name']}", f"Dosage: {record['dosage']} - {record['frequency']}", f"Duration: {record['duration']}"]
                         if record['instructions']:
-                            st.write(f"Instructions: {record['instructions']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Instructions: {record['instructions']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         st.success(record['status'])
                     with col3:
@@ -720,19 +746,18 @@ def show_module_content(module_name):
         
         # View saved diagnoses
         st.markdown("### 📋 Saved Diagnoses")
-        diagnosis_records = data_manager.load_data("diagnoses")
+        diagnosis_records = load_cached_data("diagnoses")
         if diagnosis_records:
-            for record in diagnosis_records:
+            for record in paginate_records(diagnosis_records, "diagnosis"):
                 with st.container():
                     col1, col2 = st.columns([4, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['diagnosis']}")
-                        st.write(f"Doctor: {record['doctor']}")
-                        st.write(f"Date: {record['date_diagnosed']}")
+                        details = [f"**{record['patient_name']}** - {record['diagnosis']}", f"Doctor: {record['doctor']}", f"Date: {record['date_diagnosed']}"]
                         if record['symptoms']:
-                            st.write(f"Symptoms: {record['symptoms']}")
+                            details.append(f"Symptoms: {record['symptoms']}")
                         if record['treatment_plan']:
-                            st.write(f"Treatment: {record['treatment_plan']}")
+                            details.append(f"Treatment: {record['treatment_plan']}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         if st.button("🗑️", key=f"del_diagnosis_{record['id']}"):
                             data_manager.delete_data("diagnoses", record['id'])
@@ -768,17 +793,17 @@ def show_module_content(module_name):
         
         # View saved mood entries
         st.markdown("### 📋 Mood History")
-        mood_records = data_manager.load_data("mood_tracker")
+        mood_records = load_cached_data("mood_tracker")
         if mood_records:
-            for record in mood_records:
+            for record in paginate_records(mood_records, "mood"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['mood']}")
-                        st.write(f"Energy: {record['energy_level']} | Sleep: {record['sleep_hours']}h")
+                        details = [f"**{record['patient_name']}** - {record['mood']}", f"Energy: {record['energy_level']} | Sleep: {record['sleep_hours']}h"]
                         if record['notes']:
-                            st.write(f"Notes: {record['notes']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Notes: {record['notes']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         st.write(record['mood'])
                     with col3:
@@ -820,26 +845,18 @@ def show_module_content(module_name):
         
         # View saved lab reports
         st.markdown("### 📋 Saved Lab Reports")
-        lab_records = data_manager.load_data("lab_reports")
+        lab_records = load_cached_data("lab_reports")
         if lab_records:
-            for record in lab_records:
+            for record in paginate_records(lab_records, "lab"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['test_name']}")
-                        st.write(f"Date: {record['test_date']}")
-                        st.write(f"Value: {record['value']} (Range: {record['reference_range']})")
+                        details = [f"**{record['patient_name']}** - {record['test_name']}", f"Date: {record['test_date']}", f"Value: {record['value']} (Range: {record['reference_range']})"]
                         if record['notes']:
-                            st.write(f"Notes: {record['notes']}")
+                            details.append(f"Notes: {record['notes']}")
+                        st.markdown("\n\n".join(details))
                     with col2:
-                        if record['result'] == "Normal":
-                            st.success(record['result'])
-                        elif record['result'] == "Abnormal":
-                            st.warning(record['result'])
-                        elif record['result'] == "Critical":
-                            st.error(record['result'])
-                        else:
-                            st.info(record['result'])
+                        show_status(record['result'], LAB_RESULT_STYLES)
                     with col3:
                         if st.button("🗑️", key=f"del_lab_{record['id']}"):
                             data_manager.delete_data("lab_reports", record['id'])
@@ -874,18 +891,19 @@ def show_module_content(module_name):
         
         # View saved navigation requests
         st.markdown("### 📋 Navigation History")
-        nav_records = data_manager.load_data("navigation")
+        nav_records = load_cached_data("navigation")
         if nav_records:
-            for record in nav_records:
+            for record in paginate_records(nav_records, "nav"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** → {record['destination']}")
+                        details = [f"**{record['patient_name']}** → {record['destination']}"]
                         if record['special_needs']:
-                            st.write(f"Special Needs: {', '.join(record['special_needs'])}")
+                            details.append(f"Special Needs: {', '.join(record['special_needs'])}")
                         if record['notes']:
-                            st.write(f"Notes: {record['notes']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Notes: {record['notes']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         st.info(record['status'])
                     with col3:
@@ -924,24 +942,19 @@ def show_module_content(module_name):
         
         # View saved emergency alerts
         st.markdown("### 📋 Emergency Alert History")
-        emergency_records = data_manager.load_data("emergency_alerts")
+        emergency_records = load_cached_data("emergency_alerts")
         if emergency_records:
-            for record in emergency_records:
+            for record in paginate_records(emergency_records, "emergency"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['emergency_type']}")
-                        st.write(f"Location: {record['location']}")
+                        details = [f"**{record['patient_name']}** - {record['emergency_type']}", f"Location: {record['location']}"]
                         if record['description']:
-                            st.write(f"Description: {record['description']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Description: {record['description']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
-                        if record['severity'] == "Critical":
-                            st.error(record['severity'])
-                        elif record['severity'] == "High":
-                            st.warning(record['severity'])
-                        else:
-                            st.info(record['severity'])
+                        show_status(record['severity'], EMERGENCY_SEVERITY_STYLES)
                     with col3:
                         if st.button("🗑️", key=f"del_emergency_{record['id']}"):
                             data_manager.delete_data("emergency_alerts", record['id'])
@@ -977,17 +990,17 @@ def show_module_content(module_name):
         
         # View saved education records
         st.markdown("### 📋 Education History")
-        education_records = data_manager.load_data("education")
+        education_records = load_cached_data("education")
         if education_records:
-            for record in education_records:
+            for record in paginate_records(education_records, "education"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['topic']}")
-                        st.write(f"Material: {record['material_type']} ({record['duration']} min)")
+                        details = [f"**{record['patient_name']}** - {record['topic']}", f"Material: {record['material_type']} ({record['duration']} min)"]
                         if record['notes']:
-                            st.write(f"Notes: {record['notes']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Notes: {record['notes']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         st.success("Completed")
                     with col3:
@@ -1029,28 +1042,23 @@ def show_module_content(module_name):
         
         # View saved billing records
         st.markdown("### 📋 Billing History")
-        billing_records = data_manager.load_data("billing")
+        billing_records = load_cached_data("billing")
         if billing_records:
-            for record in billing_records:
+            for record in paginate_records(billing_records, "billing"):
                 with st.container():
                     col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['service']}")
-                        st.write(f"Insurance: {record['insurance_coverage']}%")
+                        details = [f"**{record['patient_name']}** - {record['service']}", f"Insurance: {record['insurance_coverage']}%"]
                         if record['notes']:
-                            st.write(f"Notes: {record['notes']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Notes: {record['notes']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
                         st.write(f"Total: ${record['amount']:.2f}")
                     with col3:
                         st.write(f"Your Cost: ${record['patient_responsibility']:.2f}")
                     with col4:
-                        if record['payment_status'] == "Paid":
-                            st.success(record['payment_status'])
-                        elif record['payment_status'] == "Pending":
-                            st.info(record['payment_status'])
-                        else:
-                            st.warning(record['payment_status'])
+                        show_status(record['payment_status'], PAYMENT_STATUS_STYLES, "warning")
                         if st.button("🗑️", key=f"del_billing_{record['id']}"):
                             data_manager.delete_data("billing", record['id'])
                             st.rerun()
@@ -1089,25 +1097,19 @@ def show_module_content(module_name):
         
         # View saved doctor recommendations
         st.markdown("### 📋 Doctor Recommendations")
-        doctor_records = data_manager.load_data("doctor_recommendations")
+        doctor_records = load_cached_data("doctor_recommendations")
         if doctor_records:
-            for record in doctor_records:
+            for record in paginate_records(doctor_records, "doctor"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - {record['doctor_name']}")
-                        st.write(f"Specialty: {record['specialty']} | Hospital: {record['hospital']}")
-                        st.write(f"Rating: {'⭐' * record['rating']}")
+                        details = [f"**{record['patient_name']}** - {record['doctor_name']}", f"Specialty: {record['specialty']} | Hospital: {record['hospital']}", f"Rating: {RATING_STARS[min(5, int(record['rating']))]}"]
                         if record['notes']:
-                            st.write(f"Notes: {record['notes']}")
-                        st.write(f"Date: {record['timestamp'][:10]}")
+                            details.append(f"Notes: {record['notes']}")
+                        details.append(f"Date: {record['timestamp'][:10]}")
+                        st.markdown("\n\n".join(details))
                     with col2:
-                        if record['availability'] == "Available":
-                            st.success(record['availability'])
-                        elif record['availability'] == "Limited":
-                            st.warning(record['availability'])
-                        else:
-                            st.error(record['availability'])
+                        show_status(record['availability'], DOCTOR_AVAILABILITY_STYLES, "error")
                     with col3:
                         if st.button("🗑️", key=f"del_doctor_{record['id']}"):
                             data_manager.delete_data("doctor_recommendations", record['id'])
@@ -1147,24 +1149,18 @@ def show_module_content(module_name):
         
         # View saved ward records
         st.markdown("### 📋 Ward Records")
-        ward_records = data_manager.load_data("ward_monitoring")
+        ward_records = load_cached_data("ward_monitoring")
         if ward_records:
-            for record in ward_records:
+            for record in paginate_records(ward_records, "ward"):
                 with st.container():
                     col1, col2, col3 = st.columns([3, 1, 1])
                     with col1:
-                        st.write(f"**{record['patient_name']}** - Room {record['room_number']}")
-                        st.write(f"Ward: {record['ward_type']}")
-                        st.write(f"Admission: {record['admission_date']} | Discharge: {record['expected_discharge']}")
+                        details = [f"**{record['patient_name']}** - Room {record['room_number']}", f"Ward: {record['ward_type']}", f"Admission: {record['admission_date']} | Discharge: {record['expected_discharge']}"]
                         if record['notes']:
-                            st.write(f"Notes: {record['notes']}")
+                            details.append(f"Notes: {record['notes']}")
+                        st.markdown("\n\n".join(details))
                     with col2:
-                        if record['status'] == "Discharged":
-                            st.success(record['status'])
-                        elif record['status'] == "Ready for Discharge":
-                            st.info(record['status'])
-                        else:
-                            st.warning(record['status'])
+                        show_status(record['status'], WARD_STATUS_STYLES, "warning")
                     with col3:
                         if st.button("🗑️", key=f"del_ward_{record['id']}"):
                             data_manager.delete_data("ward_monitoring", record['id'])
@@ -1195,7 +1191,7 @@ def show_module_content(module_name):
         total_records = 0
         
         for data_type in data_types:
-            records = data_manager.load_data(data_type)
+            records = load_cached_data(data_type)
             total_records += len(records)
             # Count unique patients
             patients = set()
@@ -1269,7 +1265,7 @@ def show_module_content(module_name):
             import json
             all_data = {}
             for data_type in data_types:
-                all_data[data_type] = data_manager.load_data(data_type)
+                all_data[data_type] = load_cached_data(data_type)
             
             # Add token data
             all_data['tokens'] = token_manager._load_tokens()
@@ -11,9 +11,14 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.auth import check_authentication
 from utils.database import db
-from utils.ui_components import create_metric_card, create_alert_box
+from utils.ui_components import create_metric_cards
 from config.themes import get_theme_css
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_cached_statistics():
+    """Get hospital statistics, recomputed at most once a minute"""
+    return db.get_statistics()
+
 def main():
     """Main function for Admin Dashboard module"""
     
@@ -39,22 +44,15 @@ def main():
     """, unsafe_allow_html=True)
     
     # System statistics
-    stats = db.get_statistics()
+    stats = get_cached_statistics()
     
     # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        create_metric_card("Total Patients", stats["total_patients"], "👥")
-    
-    with col2:
-        create_metric_card("Total Doctors", stats["total_doctors"], "👨‍⚕️")
-    
-    with col3:
-        create_metric_card("Total Appointments", stats["total_appointments"], "📅")
-    
-    with col4:
-        create_metric_card("Active Emergencies", stats["active_emergencies"], "🚨")
+    create_metric_cards([
+        ("Total Patients", stats["total_patients"], "👥"),
+        ("Total Doctors", stats["total_doctors"], "👨‍⚕️"),
+        ("Total Appointments", stats["total_appointments"], "📅"),
+        ("Active Emergencies", stats["active_emergencies"], "🚨")
+    ])
     
     # Admin modules
     st.markdown("### 🧭 Admin Modules")
@@ -90,6 +88,7 @@ def main():
     
     with col3:
         if st.button("🔄 Refresh Data"):
+            get_cached_statistics.clear()
             st.rerun()
 
 if __name__ == "__main__":
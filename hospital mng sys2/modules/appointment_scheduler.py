@@ -206,10 +206,12 @@ def main():
             if available_doctors:
                 # Doctor selection
                 doctor_options = [f"{doc['name']} - {doc['specialization']} (₹{doc['consultation_fee']})" for doc in available_doctors]
-                selected_doctor_option = st.selectbox("Select Doctor", doctor_options)
+                selected_doctor_option = st.selectbox(
+                    "Select Doctor", range(len(doctor_options)), format_func=doctor_options.__getitem__
+                )
                 
                 # Get selected doctor
-                selected_doctor = available_doctors[doctor_options.index(selected_doctor_option)]
+                selected_doctor = available_doctors[selected_doctor_option]
                 
                 # Get optimal time slots
                 optimal_slots = scheduler.predict_optimal_slots(
@@ -310,7 +312,8 @@ def create_calendar_view():
         with cols[i]:
             st.markdown(f"**{day}**")
     
-    # Calendar days
+    # Calendar days; look booked dates up in one set instead of scanning appointments per day
+    booked_dates = db.get_appointment_dates()
     for week in cal:
         cols = st.columns(7)
         for i, day in enumerate(week):
@@ -318,9 +321,8 @@ def create_calendar_view():
                 if day != 0:
                     # Check if day has appointments
                     date_str = f"{year}-{month:02d}-{day:02d}"
-                    appointments = [apt for apt in db.appointments if apt["date"] == date_str]
                     
-                    if appointments:
+                    if date_str in booked_dates:
                         st.markdown(f"<div style='background: #667eea; color: white; padding: 5px; border-radius: 5px; text-align: center;'>{day}</div>", unsafe_allow_html=True)
                     else:
                         st.markdown(f"<div style='padding: 5px; text-align: center;'>{day}</div>", unsafe_allow_html=True)
@@ -329,25 +331,24 @@ def create_appointment_analytics():
     """Create appointment analytics dashboard"""
     st.markdown("### 📈 Appointment Analytics")
     
-    # Get appointment data
-    appointments_df = pd.DataFrame(db.appointments)
+    # Get appointment data, keeping only the charted columns
+    appointments_df = pd.DataFrame(db.appointments, columns=['date', 'doctor_id'])
     
     if not appointments_df.empty:
         # Convert date column
         appointments_df['date'] = pd.to_datetime(appointments_df['date'])
+        appointments_df['doctor_id'] = appointments_df['doctor_id'].astype('category')
         
         # Daily appointments trend
         daily_appointments = appointments_df.groupby('date').size().reset_index(name='count')
         
-        fig = px.line(daily_appointments, x='date', y='count', title='Daily Appointment Trend')
-        fig.update_layout(height=300)
+        fig = px.line(daily_appointments, x='date', y='count', title='Daily Appointment Trend', height=300)
         st.plotly_chart(fig, use_container_width=True)
         
         # Doctor-wise appointments
-        doctor_appointments = appointments_df.groupby('doctor_id').size().reset_index(name='count')
+        doctor_appointments = appointments_df.groupby('doctor_id', observed=True).size().reset_index(name='count')
         
-        fig2 = px.bar(doctor_appointments, x='doctor_id', y='count', title='Appointments by Doctor')
-        fig2.update_layout(height=300)
+        fig2 = px.bar(doctor_appointments, x='doctor_id', y='count', title='Appointments by Doctor', height=300)
         st.plotly_chart(fig2, use_container_width=True)
     else:
         st.info("No appointment data available for analytics.")
@@ -6,7 +6,7 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from utils.auth import BiometricAuth, create_login_form, check_authentication
+from utils.auth import get_biometric_auth, create_login_form, check_authentication
 from utils.database import db
 from utils.ui_components import create_glow_button, create_metric_card, create_alert_box
 from utils.voice_utils import VoiceAssistant
@@ -118,7 +118,7 @@ def fingerprint_authentication():
         """, unsafe_allow_html=True)
     
     if st.button("🔐 Start Fingerprint Scan", use_container_width=True):
-        auth = BiometricAuth()
+        auth = get_biometric_auth()
         if auth.login_user(None, None, "fingerprint"):
             st.success("✅ Fingerprint authentication successful!")
             st.rerun()
@@ -180,7 +180,7 @@ def traditional_login():
             submit_button = st.form_submit_button("🔐 Login", use_container_width=True)
         
         if submit_button:
-            auth = BiometricAuth()
+            auth = get_biometric_auth()
             if auth.login_user(username, password, "password"):
                 st.success("✅ Login successful!")
                 st.rerun()
@@ -290,7 +290,7 @@ def display_patient_information():
     # Logout option
     st.markdown("---")
     if st.button("🚪 Logout"):
-        auth = BiometricAuth()
+        auth = get_biometric_auth()
         auth.logout_user()
         st.rerun()
 
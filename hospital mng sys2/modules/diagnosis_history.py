@@ -5,6 +5,7 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from operator import itemgetter
 import plotly.express as px
 import plotly.graph_objects as go
 
@@ -16,6 +17,68 @@ from utils.database import db
 from utils.ui_components import create_metric_card, create_alert_box, create_timeline_chart, create_radar_chart
 from config.themes import get_theme_css
 
+# Sample diagnoses used to simulate AI diagnosis
+SAMPLE_DIAGNOSES = [
+    {
+        'condition': 'Hypertension',
+        'category': 'Cardiovascular',
+        'severity': 'Moderate',
+        'confidence': 0.85,
+        'symptoms': ['High blood pressure', 'Headache', 'Dizziness'],
+        'treatment': 'Lifestyle changes, Medication',
+        'follow_up': '3 months'
+    },
+    {
+        'condition': 'Type 2 Diabetes',
+        'category': 'Endocrine',
+        'severity': 'Mild',
+        'confidence': 0.92,
+        'symptoms': ['Increased thirst', 'Frequent urination', 'Fatigue'],
+        'treatment': 'Diet control, Metformin',
+        'follow_up': '1 month'
+    },
+    {
+        'condition': 'Asthma',
+        'category': 'Respiratory',
+        'severity': 'Moderate',
+        'confidence': 0.78,
+        'symptoms': ['Wheezing', 'Shortness of breath', 'Chest tightness'],
+        'treatment': 'Inhalers, Avoid triggers',
+        'follow_up': '6 months'
+    },
+    {
+        'condition': 'Depression',
+        'category': 'Psychiatric',
+        'severity': 'Mild',
+        'confidence': 0.81,
+        'symptoms': ['Low mood', 'Loss of interest', 'Sleep problems'],
+        'treatment': 'Therapy, Antidepressants',
+        'follow_up': '2 weeks'
+    }
+]
+
+# Simulated health risk predictions
+HEALTH_RISKS = [
+    {
+        'risk_type': 'Cardiovascular Risk',
+        'probability': 0.75,
+        'severity': 'High',
+        'recommendations': ['Regular BP monitoring', 'Heart-healthy diet', 'Exercise']
+    },
+    {
+        'risk_type': 'Diabetes Complications',
+        'probability': 0.60,
+        'severity': 'Medium',
+        'recommendations': ['Blood sugar monitoring', 'Foot care', 'Eye exams']
+    },
+    {
+        'risk_type': 'Respiratory Issues',
+        'probability': 0.45,
+        'severity': 'Medium',
+        'recommendations': ['Avoid smoking', 'Air purifier', 'Regular check-ups']
+    }
+]
+
 class DiagnosisHistoryTracker:
     def __init__(self):
         self.diagnosis_categories = [
@@ -52,46 +115,7 @@ class DiagnosisHistoryTracker:
     def simulate_diagnosis(self, appointment):
         """Simulate AI diagnosis based on appointment data"""
         # Sample diagnosis data
-        diagnoses = [
-            {
-                'condition': 'Hypertension',
-                'category': 'Cardiovascular',
-                'severity': 'Moderate',
-                'confidence': 0.85,
-                'symptoms': ['High blood pressure', 'Headache', 'Dizziness'],
-                'treatment': 'Lifestyle changes, Medication',
-                'follow_up': '3 months'
-            },
-            {
-                'condition': 'Type 2 Diabetes',
-                'category': 'Endocrine',
-                'severity': 'Mild',
-                'confidence': 0.92,
-                'symptoms': ['Increased thirst', 'Frequent urination', 'Fatigue'],
-                'treatment': 'Diet control, Metformin',
-                'follow_up': '1 month'
-            },
-            {
-                'condition': 'Asthma',
-                'category': 'Respiratory',
-                'severity': 'Moderate',
-                'confidence': 0.78,
-                'symptoms': ['Wheezing', 'Shortness of breath', 'Chest tightness'],
-                'treatment': 'Inhalers, Avoid triggers',
-                'follow_up': '6 months'
-            },
-            {
-                'condition': 'Depression',
-                'category': 'Psychiatric',
-                'severity': 'Mild',
-                'confidence': 0.81,
-                'symptoms': ['Low mood', 'Loss of interest', 'Sleep problems'],
-                'treatment': 'Therapy, Antidepressants',
-                'follow_up': '2 weeks'
-            }
-        ]
-        
-        return np.random.choice(diagnoses)
+        return SAMPLE_DIAGNOSES[np.random.randint(len(SAMPLE_DIAGNOSES))]
     
     def analyze_diagnosis_trends(self, diagnosis_history):
         """Analyze diagnosis trends and patterns"""
@@ -131,28 +155,7 @@ class DiagnosisHistoryTracker:
             return []
         
         # Simulate risk prediction
-        risks = [
-            {
-                'risk_type': 'Cardiovascular Risk',
-                'probability': 0.75,
-                'severity': 'High',
-                'recommendations': ['Regular BP monitoring', 'Heart-healthy diet', 'Exercise']
-            },
-            {
-                'risk_type': 'Diabetes Complications',
-                'probability': 0.60,
-                'severity': 'Medium',
-                'recommendations': ['Blood sugar monitoring', 'Foot care', 'Eye exams']
-            },
-            {
-                'risk_type': 'Respiratory Issues',
-                'probability': 0.45,
-                'severity': 'Medium',
-                'recommendations': ['Avoid smoking', 'Air purifier', 'Regular check-ups']
-            }
-        ]
-        
-        return risks
+        return HEALTH_RISKS
 
 def main():
     """Main function for AI Diagnosis History Tracker module"""
@@ -184,12 +187,15 @@ def main():
         st.error("No patients found in the system")
         return
     
-    patient_names = [f"{p['name']} (ID: {p['id']})" for p in patients]
-    selected_patient = st.selectbox("Select Patient", patient_names)
+    patients_by_id = {p['id']: p for p in patients}
+    patient_id = st.selectbox(
+        "Select Patient",
+        list(patients_by_id),
+        format_func=lambda pid: f"{patients_by_id[pid]['name']} (ID: {pid})"
+    )
     
-    if selected_patient:
-        patient_id = selected_patient.split("(ID: ")[1].split(")")[0]
-        patient = next((p for p in patients if p['id'] == patient_id), None)
+    if patient_id:
+        patient = patients_by_id[patient_id]
         
         if patient:
             # Display patient info
@@ -225,7 +231,7 @@ def main():
                     create_metric_card("Categories", categories, "🏷️")
                 
                 with col4:
-                    recent_diagnosis = max(diagnosis_history, key=lambda x: x['date'])
+                    recent_diagnosis = max(diagnosis_history, key=itemgetter('date'))
                     create_metric_card("Latest", recent_diagnosis['diagnosis'], "🆕")
                 
                 # Diagnosis timeline
@@ -302,10 +308,8 @@ def main():
                             alert_message = f"**{risk['risk_type']}** - Probability: {risk['probability']:.1%}"
                             create_alert_box(alert_message, alert_type)
                             
-                            st.markdown("**Recommendations:**")
-                            for rec in risk['recommendations']:
-                                st.markdown(f"• {rec}")
-                            st.markdown("---")
+                            recommendations = "\n\n".join(f"• {rec}" for rec in risk['recommendations'])
+                            st.markdown(f"**Recommendations:**\n\n{recommendations}\n\n---")
                     else:
                         st.success("✅ No significant health risks detected")
                 
@@ -1,6 +1,11 @@
 import streamlit as st
 import sys
 import os
+import re
+import heapq
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -14,6 +19,56 @@ from utils.database import db
 from utils.ui_components import create_metric_card, create_alert_box, create_progress_bar
 from config.themes import get_theme_css
 
+# Symptom keywords and the specializations that treat them
+SYMPTOM_SPECIALIZATIONS = {
+    "chest pain": ["Cardiology", "Emergency Medicine"],
+    "headache": ["Neurology", "Emergency Medicine"],
+    "joint pain": ["Orthopedics", "Rheumatology"],
+    "skin rash": ["Dermatology"],
+    "fever": ["Pediatrics", "Internal Medicine", "Emergency Medicine"],
+    "depression": ["Psychiatry"],
+    "diabetes": ["Endocrinology"],
+    "stomach pain": ["Gastroenterology"],
+    "shortness of breath": ["Pulmonology", "Cardiology", "Emergency Medicine"],
+    "cancer": ["Oncology"]
+}
+SYMPTOM_KEYWORDS = frozenset(SYMPTOM_SPECIALIZATIONS)
+
+# One alternation over every keyword, found as substrings ("headaches", "chest pains") in a single pass;
+# the zero-width lookahead tries every position, so overlapping keywords match just as `in` would
+SYMPTOM_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(SYMPTOM_KEYWORDS, key=len, reverse=True))) + "))"
+)
+
+# Keyword x specialization incidence matrix for vectorized match counting
+KEYWORD_NAMES = list(SYMPTOM_SPECIALIZATIONS)
+KEYWORD_INDEX = {keyword: i for i, keyword in enumerate(KEYWORD_NAMES)}
+SPECIALIZATION_NAMES = sorted({spec for specs in SYMPTOM_SPECIALIZATIONS.values() for spec in specs})
+KEYWORD_SPECIALIZATION_MATRIX = np.array([
+    [spec in SYMPTOM_SPECIALIZATIONS[keyword] for spec in SPECIALIZATION_NAMES]
+    for keyword in KEYWORD_NAMES
+], dtype=np.int32)
+
+@lru_cache(maxsize=256)
+def match_symptom_keywords(symptom):
+    """Return the symptom keywords found in a free-text symptom"""
+    return frozenset(SYMPTOM_KEYWORD_PATTERN.findall(symptom.lower()))
+
+def count_specialization_matches(symptoms):
+    """Return {specialization: number of symptoms it treats} for the given symptoms"""
+    if not symptoms:
+        return {}
+    
+    # One row per symptom with its matched keywords set
+    hits = np.zeros((len(symptoms), len(KEYWORD_NAMES)), dtype=np.int32)
+    for row, symptom in enumerate(symptoms):
+        for keyword in match_symptom_keywords(symptom):
+            hits[row, KEYWORD_INDEX[keyword]] = 1
+    
+    # A symptom counts once per specialization however many of its keywords point there
+    counts = ((hits @ KEYWORD_SPECIALIZATION_MATRIX) > 0).sum(axis=0)
+    return {spec: int(count) for spec, count in zip(SPECIALIZATION_NAMES, counts) if count}
+
 class AIDoctorRecommendationEngine:
     def __init__(self):
         self.specializations = [
@@ -22,18 +77,7 @@ class AIDoctorRecommendationEngine:
             "Endocrinology", "Gastroenterology", "Pulmonology", "Emergency Medicine"
         ]
         
-        self.symptom_specialization_mapping = {
-            "chest pain": ["Cardiology", "Emergency Medicine"],
-            "headache": ["Neurology", "Emergency Medicine"],
-            "joint pain": ["Orthopedics", "Rheumatology"],
-            "skin rash": ["Dermatology"],
-            "fever": ["Pediatrics", "Internal Medicine", "Emergency Medicine"],
-            "depression": ["Psychiatry"],
-            "diabetes": ["Endocrinology"],
-            "stomach pain": ["Gastroenterology"],
-            "shortness of breath": ["Pulmonology", "Cardiology", "Emergency Medicine"],
-            "cancer": ["Oncology"]
-        }
+        self.symptom_specialization_mapping = SYMPTOM_SPECIALIZATIONS
     
     def get_doctors_by_specialization(self, specialization):
         """Get doctors by specialization"""
@@ -43,32 +87,29 @@ class AIDoctorRecommendationEngine:
     def recommend_doctors(self, symptoms, preferences=None):
         """Recommend doctors based on symptoms and preferences"""
         # Map symptoms to specializations
-        recommended_specializations = set()
-        
-        for symptom in symptoms:
-            symptom_lower = symptom.lower()
-            for key, specs in self.symptom_specialization_mapping.items():
-                if key in symptom_lower:
-                    recommended_specializations.update(specs)
+        specialization_matches = count_specialization_matches(symptoms)
         
         # Get doctors for recommended specializations
         recommended_doctors = []
         
-        for spec in recommended_specializations:
+        for spec in specialization_matches:
             doctors = self.get_doctors_by_specialization(spec)
             for doctor in doctors:
                 # Calculate recommendation score
-                score = self.calculate_recommendation_score(doctor, symptoms, preferences)
+                score = self.calculate_recommendation_score(doctor, symptoms, preferences, specialization_matches)
                 doctor['recommendation_score'] = score
                 recommended_doctors.append(doctor)
         
         # Sort by recommendation score
-        recommended_doctors.sort(key=lambda x: x['recommendation_score'], reverse=True)
+        recommended_doctors.sort(key=itemgetter('recommendation_score'), reverse=True)
         
         return recommended_doctors
     
-    def calculate_recommendation_score(self, doctor, symptoms, preferences=None):
+    def calculate_recommendation_score(self, doctor, symptoms, preferences=None, specialization_matches=None):
         """Calculate recommendation score for a doctor"""
+        if specialization_matches is None:
+            specialization_matches = count_specialization_matches(symptoms)
+        
         score = 0
         
         # Base score from rating
@@ -82,12 +123,7 @@ class AIDoctorRecommendationEngine:
             score += 10
         
         # Specialization match bonus
-        for symptom in symptoms:
-            symptom_lower = symptom.lower()
-            for key, specs in self.symptom_specialization_mapping.items():
-                if key in symptom_lower and doctor['specialization'] in specs:
-                    score += 15
-                    break
+        score += 15 * specialization_matches.get(doctor['specialization'], 0)
         
         # Preferences bonus
         if preferences:
@@ -162,10 +198,13 @@ class AIDoctorRecommendationEngine:
                     doctor['similarity_score'] = similarity_score
                     similar_doctors.append(doctor)
         
-        # Sort by similarity score
-        similar_doctors.sort(key=lambda x: x['similarity_score'], reverse=True)
-        
-        return similar_doctors[:3]  # Return top 3 similar doctors
+        # Top 3 similar doctors by similarity score
+        return heapq.nlargest(3, similar_doctors, key=itemgetter('similarity_score'))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def find_recommended_doctors(symptoms, preference_items):
+    """Recommend doctors for a symptom and preference query, reused across reruns"""
+    return AIDoctorRecommendationEngine().recommend_doctors(list(symptoms), dict(preference_items))
 
 def main():
     """Main function for AI Doctor Recommendation Engine module"""
@@ -230,51 +269,53 @@ def main():
                     'availability': availability
                 }
                 
-                # Get recommendations
-                recommended_doctors = recommendation_engine.recommend_doctors(symptoms, preferences)
-                
-                if recommended_doctors:
-                    st.success(f"✅ Found {len(recommended_doctors)} doctors matching your criteria!")
-                    
-                    # Display recommendations
-                    st.markdown("#### 🏆 Top Recommendations")
-                    
-                    for i, doctor in enumerate(recommended_doctors[:5], 1):
-                        with st.expander(f"🥇 {i}. Dr. {doctor['name']} - {doctor['specialization']}"):
-                            col1, col2 = st.columns([2, 1])
-                            
-                            with col1:
-                                st.markdown(f"**Specialization:** {doctor['specialization']}")
-                                st.markdown(f"**Experience:** {doctor['experience']} years")
-                                st.markdown(f"**Rating:** ⭐ {doctor.get('rating', 'N/A')}")
-                                st.markdown(f"**Status:** {doctor.get('status', 'Unknown')}")
-                            
-                            with col2:
-                                create_progress_bar(
-                                    doctor['recommendation_score'], 
-                                    100, 
-                                    f"Match: {doctor['recommendation_score']:.0f}%"
-                                )
-                            
-                            # Action buttons
-                            col1, col2, col3 = st.columns(3)
-                            
-                            with col1:
-                                if st.button(f"📋 View Details", key=f"details_{doctor['id']}"):
-                                    st.session_state.selected_doctor = doctor['id']
-                            
-                            with col2:
-                                if st.button(f"📅 Book Appointment", key=f"book_{doctor['id']}"):
-                                    st.success(f"✅ Redirecting to appointment booking for Dr. {doctor['name']}")
-                            
-                            with col3:
-                                if st.button(f"📞 Contact", key=f"contact_{doctor['id']}"):
-                                    st.info(f"📞 Contacting Dr. {doctor['name']}...")
-                else:
-                    st.warning("⚠️ No doctors found matching your criteria. Try adjusting your symptoms or preferences.")
+                # Get recommendations, kept in session state so the result buttons survive reruns
+                st.session_state.doctor_results = find_recommended_doctors(tuple(symptoms), tuple(preferences.items()))
             else:
                 st.warning("⚠️ Please enter your symptoms to find doctors.")
         
+        recommended_doctors = st.session_state.get('doctor_results')
+        if recommended_doctors is not None:
+            if recommended_doctors:
+                st.success(f"✅ Found {len(recommended_doctors)} doctors matching your criteria!")
+                
+                # Display recommendations
+                st.markdown("#### 🏆 Top Recommendations")
+                
+                for i, doctor in enumerate(recommended_doctors[:5], 1):
+                    with st.expander(f"🥇 {i}. Dr. {doctor['name']} - {doctor['specialization']}"):
+                        col1, col2 = st.columns([2, 1])
+                        
+                        with col1:
+                            st.markdown(f"**Specialization:** {doctor['specialization']}")
+                            st.markdown(f"**Experience:** {doctor['experience']} years")
+                            st.markdown(f"**Rating:** ⭐ {doctor.get('rating', 'N/A')}")
+                            st.markdown(f"**Status:** {doctor.get('status', 'Unknown')}")
+                        
+                        with col2:
+                            create_progress_bar(
+                                doctor['recommendation_score'], 
+                                100, 
+                                f"Match: {doctor['recommendation_score']:.0f}%"
+                            )
+                        
+                        # Action buttons
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            if st.button(f"📋 View Details", key=f"details_{doctor['id']}"):
+                                st.session_state.selected_doctor = doctor['id']
+                        
+                        with col2:
+                            if st.button(f"📅 Book Appointment", key=f"book_{doctor['id']}"):
+                                st.success(f"✅ Redirecting to appointment booking for Dr. {doctor['name']}")
+                        
+                        with col3:
+                            if st.button(f"📞 Contact", key=f"contact_{doctor['id']}"):
+                                st.info(f"📞 Contacting Dr. {doctor['name']}...")
+            else:
+                st.warning("⚠️ No doctors found matching your criteria. Try adjusting your symptoms or preferences.")
+        
         # Quick symptom search
         st.markdown("#### 🚀 Quick Symptom Search")
         
@@ -299,12 +340,15 @@ def main():
             st.error("No doctors found in the system")
             return
         
-        doctor_names = [f"Dr. {d['name']} - {d['specialization']}" for d in doctors]
-        selected_doctor_name = st.selectbox("Select Doctor", doctor_names)
+        doctors_by_id = {d['id']: d for d in doctors}
+        selected_doctor_id = st.selectbox(
+            "Select Doctor",
+            list(doctors_by_id),
+            format_func=lambda did: f"Dr. {doctors_by_id[did]['name']} - {doctors_by_id[did]['specialization']}"
+        )
         
-        if selected_doctor_name:
-            doctor_name = selected_doctor_name.split(" - ")[0].replace("Dr. ", "")
-            doctor = next((d for d in doctors if d['name'] == doctor_name), None)
+        if selected_doctor_id:
+            doctor = doctors_by_id[selected_doctor_id]
             
             if doctor:
                 doctor_id = doctor['id']
@@ -353,11 +397,7 @@ def main():
                 
                 availability = doctor_details.get('availability', {})
                 if availability:
-                    availability_data = []
-                    for day, time in availability.items():
-                        availability_data.append([day, time])
-                    
-                    availability_df = pd.DataFrame(availability_data, columns=["Day", "Hours"])
+                    availability_df = pd.DataFrame(list(availability.items()), columns=["Day", "Hours"])
                     st.dataframe(availability_df, use_container_width=True)
                 
                 # Action buttons
@@ -391,12 +431,16 @@ def main():
             st.error("No doctors found in the system")
             return
         
-        doctor_names = [f"Dr. {d['name']} - {d['specialization']}" for d in doctors]
-        selected_doctor_name = st.selectbox("Select Doctor to Find Similar", doctor_names, key="similar_doctor")
+        doctors_by_id = {d['id']: d for d in doctors}
+        selected_doctor_id = st.selectbox(
+            "Select Doctor to Find Similar",
+            list(doctors_by_id),
+            format_func=lambda did: f"Dr. {doctors_by_id[did]['name']} - {doctors_by_id[did]['specialization']}",
+            key="similar_doctor"
+        )
         
-        if selected_doctor_name:
-            doctor_name = selected_doctor_name.split(" - ")[0].replace("Dr. ", "")
-            doctor = next((d for d in doctors if d['name'] == doctor_name), None)
+        if selected_doctor_id:
+            doctor = doctors_by_id[selected_doctor_id]
             
             if doctor:
                 similar_doctors = recommendation_engine.get_similar_doctors(doctor['id'])
@@ -464,17 +508,10 @@ def main():
         # Specialization distribution
         st.markdown("#### 🏥 Doctors by Specialization")
         
-        spec_counts = {}
-        for doc in db.doctors:
-            spec = doc['specialization']
-            spec_counts[spec] = spec_counts.get(spec, 0) + 1
+        spec_counts = Counter(doc['specialization'] for doc in db.doctors)
         
         if spec_counts:
-            spec_data = []
-            for spec, count in spec_counts.items():
-                spec_data.append([spec, count])
-            
-            spec_df = pd.DataFrame(spec_data, columns=["Specialization", "Count"])
+            spec_df = pd.DataFrame(list(spec_counts.items()), columns=["Specialization", "Count"])
             st.dataframe(spec_df, use_container_width=True)
         
         # Top rated doctors
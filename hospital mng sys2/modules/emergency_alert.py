@@ -2,6 +2,7 @@ import streamlit as st
 import sys
 import os
 from pathlib import Path
+from itertools import islice
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -13,10 +14,20 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.auth import check_authentication
 from utils.database import db
-from utils.ui_components import create_glow_button, create_metric_card, create_alert_box
+from utils.ui_components import create_glow_button, create_metric_card, create_alert_boxes
 from utils.voice_utils import VoiceAssistant
 from config.themes import get_theme_css
 
+# Most recent active alerts drawn in the emergency panel
+MAX_ALERTS_SHOWN = 10
+
+# Banner colors by emergency severity
+SEVERITY_COLORS = {
+    "Critical": "red",
+    "High": "orange",
+    "Medium": "yellow"
+}
+
 class EmergencyAlertSystem:
     def __init__(self):
         self.emergency_types = [
@@ -158,11 +169,12 @@ def main():
         
         if active_alerts:
             st.markdown("#### ⚠️ Active Emergency Alerts")
-            for alert in active_alerts:
-                create_alert_box(
-                    f"🚨 {alert['emergency_type']} - {alert['location']} - {alert['status']}",
-                    "error"
-                )
+            create_alert_boxes([
+                (f"🚨 {alert['emergency_type']} - {alert['location']} - {alert['status']}", "error")
+                for alert in islice(reversed(active_alerts), MAX_ALERTS_SHOWN)
+            ])
+            if len(active_alerts) > MAX_ALERTS_SHOWN:
+                st.caption(f"Showing the {MAX_ALERTS_SHOWN} most recent of {len(active_alerts)} active alerts")
         
         # Emergency alert creation
         st.markdown("#### 🆘 Create Emergency Alert")
@@ -196,11 +208,7 @@ def main():
             severity = emergency_system.assess_emergency_severity(emergency_type)
             
             # Display severity
-            severity_color = {
-                "Critical": "red",
-                "High": "orange", 
-                "Medium": "yellow"
-            }.get(severity, "blue")
+            severity_color = SEVERITY_COLORS.get(severity, "blue")
             
             st.markdown(f"""
             <div style="background: {severity_color}; color: white; padding: 1rem; border-radius: 10px; text-align: center;">
@@ -399,8 +407,9 @@ def create_emergency_analytics():
     emergency_data = db.emergency_alerts
     
     if emergency_data:
-        # Convert to DataFrame
-        df = pd.DataFrame(emergency_data)
+        # Convert to DataFrame, keeping only the charted columns; the type repeats, so store it as a category
+        df = pd.DataFrame(emergency_data, columns=['emergency_type', 'created_at'])
+        df['emergency_type'] = df['emergency_type'].astype('category')
         df['created_at'] = pd.to_datetime(df['created_at'])
         
         # Emergency types distribution
@@ -409,9 +418,9 @@ def create_emergency_analytics():
         fig = px.pie(
             values=emergency_types.values,
             names=emergency_types.index,
-            title="Emergency Types Distribution"
+            title="Emergency Types Distribution",
+            height=400
         )
-        fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
         
         # Daily emergency trend
@@ -421,9 +430,9 @@ def create_emergency_analytics():
             daily_emergencies,
             x='created_at',
             y='count',
-            title="Daily Emergency Alerts Trend"
+            title="Daily Emergency Alerts Trend",
+            height=300
         )
-        fig2.update_layout(height=300)
         st.plotly_chart(fig2, use_container_width=True)
     else:
         st.info("No emergency data available for analytics.")
@@ -14,10 +14,19 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.auth import check_authentication
 from utils.database import db
-from utils.ui_components import create_vital_signs_chart, create_metric_card, create_alert_box
+from utils.ui_components import create_vital_signs_chart, create_metric_card, create_metric_cards, create_alert_boxes
 from utils.voice_utils import VoiceAssistant
 from config.themes import get_theme_css
 
+# Shared generator for simulated vital signs
+RNG = np.random.default_rng()
+
+# Vitals used for health scoring, with their normal ranges in the same order
+SCORED_VITALS = ("heart_rate", "blood_pressure_systolic", "blood_pressure_diastolic",
+                 "temperature", "oxygen_saturation", "blood_glucose")
+VITAL_LOWER_LIMITS = np.array([60, 90, 60, 36.0, 95, 70])
+VITAL_UPPER_LIMITS = np.array([100, 140, 90, 37.5, np.inf, 140])
+
 class HealthDashboard:
     def __init__(self):
         self.vital_signs = {}
@@ -42,25 +51,25 @@ class HealthDashboard:
         current_vitals = {}
         for vital, base_value in base_values.items():
             if vital == "blood_pressure_systolic":
-                variation = np.random.normal(0, 5)
+                variation = RNG.normal(0, 5)
                 current_vitals[vital] = max(90, min(140, base_value + variation))
             elif vital == "blood_pressure_diastolic":
-                variation = np.random.normal(0, 3)
+                variation = RNG.normal(0, 3)
                 current_vitals[vital] = max(60, min(90, base_value + variation))
             elif vital == "heart_rate":
-                variation = np.random.normal(0, 8)
+                variation = RNG.normal(0, 8)
                 current_vitals[vital] = max(60, min(100, base_value + variation))
             elif vital == "temperature":
-                variation = np.random.normal(0, 0.3)
+                variation = RNG.normal(0, 0.3)
                 current_vitals[vital] = max(36.0, min(37.5, base_value + variation))
             elif vital == "oxygen_saturation":
-                variation = np.random.normal(0, 1)
+                variation = RNG.normal(0, 1)
                 current_vitals[vital] = max(95, min(100, base_value + variation))
             elif vital == "respiratory_rate":
-                variation = np.random.normal(0, 2)
+                variation = RNG.normal(0, 2)
                 current_vitals[vital] = max(12, min(20, base_value + variation))
             elif vital == "blood_glucose":
-                variation = np.random.normal(0, 10)
+                variation = RNG.normal(0, 10)
                 current_vitals[vital] = max(70, min(140, base_value + variation))
             else:
                 current_vitals[vital] = base_value
@@ -72,67 +81,82 @@ class HealthDashboard:
     
     def check_vital_alerts(self, vitals):
         """Check for abnormal vital signs and generate alerts"""
-        alerts = []
-        
-        # Heart rate alerts
+        checks = (
+            self.heart_rate_alert(vitals),
+            self.blood_pressure_alert(vitals),
+            self.temperature_alert(vitals),
+            self.oxygen_saturation_alert(vitals),
+            self.blood_glucose_alert(vitals)
+        )
+        return [alert for alert in checks if alert is not None]
+    
+    def heart_rate_alert(self, vitals):
+        """Heart rate alert, or None if normal"""
         if vitals["heart_rate"] > 100:
-            alerts.append({
+            return {
                 "type": "warning",
                 "message": f"⚠️ High heart rate: {vitals['heart_rate']} BPM",
                 "severity": "moderate"
-            })
-        elif vitals["heart_rate"] < 60:
-            alerts.append({
+            }
+        if vitals["heart_rate"] < 60:
+            return {
                 "type": "warning",
                 "message": f"⚠️ Low heart rate: {vitals['heart_rate']} BPM",
                 "severity": "moderate"
-            })
-        
-        # Blood pressure alerts
+            }
+        return None
+    
+    def blood_pressure_alert(self, vitals):
+        """Blood pressure alert, or None if normal"""
         if vitals["blood_pressure_systolic"] > 140:
-            alerts.append({
+            return {
                 "type": "error",
                 "message": f"🚨 High blood pressure: {vitals['blood_pressure_systolic']}/{vitals['blood_pressure_diastolic']}",
                 "severity": "high"
-            })
-        elif vitals["blood_pressure_systolic"] < 90:
-            alerts.append({
+            }
+        if vitals["blood_pressure_systolic"] < 90:
+            return {
                 "type": "error",
                 "message": f"🚨 Low blood pressure: {vitals['blood_pressure_systolic']}/{vitals['blood_pressure_diastolic']}",
                 "severity": "high"
-            })
-        
-        # Temperature alerts
+            }
+        return None
+    
+    def temperature_alert(self, vitals):
+        """Temperature alert, or None if normal"""
         if vitals["temperature"] > 37.5:
-            alerts.append({
+            return {
                 "type": "warning",
                 "message": f"🌡️ Elevated temperature: {vitals['temperature']:.1f}°C",
                 "severity": "moderate"
-            })
-        
-        # Oxygen saturation alerts
+            }
+        return None
+    
+    def oxygen_saturation_alert(self, vitals):
+        """Oxygen saturation alert, or None if normal"""
         if vitals["oxygen_saturation"] < 95:
-            alerts.append({
+            return {
                 "type": "error",
                 "message": f"🫁 Low oxygen saturation: {vitals['oxygen_saturation']}%",
                 "severity": "high"
-            })
-        
-        # Blood glucose alerts
+            }
+        return None
+    
+    def blood_glucose_alert(self, vitals):
+        """Blood glucose alert, or None if normal"""
         if vitals["blood_glucose"] > 140:
-            alerts.append({
+            return {
                 "type": "warning",
                 "message": f"🍬 High blood glucose: {vitals['blood_glucose']} mg/dL",
                 "severity": "moderate"
-            })
-        elif vitals["blood_glucose"] < 70:
-            alerts.append({
+            }
+        if vitals["blood_glucose"] < 70:
+            return {
                 "type": "error",
                 "message": f"🍬 Low blood glucose: {vitals['blood_glucose']} mg/dL",
                 "severity": "high"
-            })
-        
-        return alerts
+            }
+        return None
     
     def get_vital_trends(self, patient_id, hours=24):
         """Get vital signs trends over time"""
@@ -153,14 +177,39 @@ class HealthDashboard:
             }[vital]
             
             # Add some trend and noise
-            trend = np.linspace(0, np.random.normal(0, 5), len(timestamps))
-            noise = np.random.normal(0, 2, len(timestamps))
+            trend = np.linspace(0, RNG.normal(0, 5), len(timestamps))
+            noise = RNG.normal(0, 2, len(timestamps))
             values = base_value + trend + noise
             
             trends[vital] = pd.Series(values, index=timestamps)
         
         return trends
 
+@st.cache_data(ttl=300, show_spinner=False)
+def build_vital_trend_figures(patient_id, hours=24):
+    """Build the heart rate and temperature trend figures, reused across reruns"""
+    trends = HealthDashboard().get_vital_trends(patient_id, hours=hours)
+    
+    fig_hr = px.line(
+        x=trends["heart_rate"].index,
+        y=trends["heart_rate"].values,
+        title=f"Heart Rate Trend ({hours} Hours)",
+        labels={"x": "Time", "y": "Heart Rate (BPM)"},
+        render_mode="webgl",
+        height=300
+    )
+    
+    fig_temp = px.line(
+        x=trends["temperature"].index,
+        y=trends["temperature"].values,
+        title=f"Temperature Trend ({hours} Hours)",
+        labels={"x": "Time", "y": "Temperature (°C)"},
+        render_mode="webgl",
+        height=300
+    )
+    
+    return fig_hr, fig_temp
+
 def main():
     """Main function for Real-Time Health Dashboard module"""
     
@@ -199,66 +248,22 @@ def main():
         current_vitals = dashboard.generate_real_time_vitals(patient_id)
         
         # Display vital signs in cards
-        vital_cols = st.columns(4)
-        
-        with vital_cols[0]:
-            create_metric_card(
-                "Heart Rate",
-                f"{current_vitals['heart_rate']:.0f} BPM",
-                "💓"
-            )
-        
-        with vital_cols[1]:
-            create_metric_card(
-                "Blood Pressure",
-                f"{current_vitals['blood_pressure_systolic']:.0f}/{current_vitals['blood_pressure_diastolic']:.0f}",
-                "🩸"
-            )
-        
-        with vital_cols[2]:
-            create_metric_card(
-                "Temperature",
-                f"{current_vitals['temperature']:.1f}°C",
-                "🌡️"
-            )
-        
-        with vital_cols[3]:
-            create_metric_card(
-                "Oxygen Saturation",
-                f"{current_vitals['oxygen_saturation']:.0f}%",
-                "🫁"
-            )
+        create_metric_cards([
+            ("Heart Rate", f"{current_vitals['heart_rate']:.0f} BPM", "💓"),
+            ("Blood Pressure",
+             f"{current_vitals['blood_pressure_systolic']:.0f}/{current_vitals['blood_pressure_diastolic']:.0f}",
+             "🩸"),
+            ("Temperature", f"{current_vitals['temperature']:.1f}°C", "🌡️"),
+            ("Oxygen Saturation", f"{current_vitals['oxygen_saturation']:.0f}%", "🫁")
+        ])
         
         # Additional vitals
-        vital_cols2 = st.columns(4)
-        
-        with vital_cols2[0]:
-            create_metric_card(
-                "Respiratory Rate",
-                f"{current_vitals['respiratory_rate']:.0f} /min",
-                "🫁"
-            )
-        
-        with vital_cols2[1]:
-            create_metric_card(
-                "Blood Glucose",
-                f"{current_vitals['blood_glucose']:.0f} mg/dL",
-                "🍬"
-            )
-        
-        with vital_cols2[2]:
-            create_metric_card(
-                "Weight",
-                f"{current_vitals['weight']:.1f} kg",
-                "⚖️"
-            )
-        
-        with vital_cols2[3]:
-            create_metric_card(
-                "Last Updated",
-                current_vitals['timestamp'].strftime("%H:%M:%S"),
-                "🕐"
-            )
+        create_metric_cards([
+            ("Respiratory Rate", f"{current_vitals['respiratory_rate']:.0f} /min", "🫁"),
+            ("Blood Glucose", f"{current_vitals['blood_glucose']:.0f} mg/dL", "🍬"),
+            ("Weight", f"{current_vitals['weight']:.1f} kg", "⚖️"),
+            ("Last Updated", current_vitals['timestamp'].strftime("%H:%M:%S"), "🕐")
+        ])
         
         # Real-time charts
         st.markdown("### 📈 Vital Signs Trends")
@@ -276,28 +281,11 @@ def main():
                 st.rerun()
         
         with tab2:
-            # 24-hour trends
-            trends = dashboard.get_vital_trends(patient_id, hours=24)
-            
-            # Heart rate trend
-            fig_hr = px.line(
-                x=trends["heart_rate"].index,
-                y=trends["heart_rate"].values,
-                title="Heart Rate Trend (24 Hours)",
-                labels={"x": "Time", "y": "Heart Rate (BPM)"}
-            )
-            fig_hr.update_layout(height=300)
-            st.plotly_chart(fig_hr, use_container_width=True)
-            
-            # Temperature trend
-            fig_temp = px.line(
-                x=trends["temperature"].index,
-                y=trends["temperature"].values,
-                title="Temperature Trend (24 Hours)",
-                labels={"x": "Time", "y": "Temperature (°C)"}
-            )
-            fig_temp.update_layout(height=300)
-            st.plotly_chart(fig_temp, use_container_width=True)
+            # 24-hour heart rate and temperature trends
+            fig_hr, fig_temp = build_vital_trend_figures(patient_id, hours=24)
+            # Stable keys let the frontend patch the mounted charts instead of re-creating them
+            st.plotly_chart(fig_hr, use_container_width=True, key="heart_rate_trend_chart")
+            st.plotly_chart(fig_temp, use_container_width=True, key="temperature_trend_chart")
         
         with tab3:
             # Alerts section
@@ -305,8 +293,7 @@ def main():
             
             if alerts:
                 st.markdown("### 🚨 Health Alerts")
-                for alert in alerts:
-                    create_alert_box(alert["message"], alert["type"])
+                create_alert_boxes([(alert["message"], alert["type"]) for alert in alerts])
             else:
                 st.success("✅ All vital signs are within normal range")
     
@@ -400,66 +387,35 @@ def main():
         if st.button("📋 Share with Doctor"):
             st.success("✅ Health data shared with your doctor!")
 
-def calculate_health_score(vitals):
-    """Calculate overall health score based on vital signs"""
-    score = 100
-    
-    # Heart rate scoring
-    if 60 <= vitals["heart_rate"] <= 100:
-        score += 0
-    else:
-        score -= 20
-    
-    # Blood pressure scoring
-    if 90 <= vitals["blood_pressure_systolic"] <= 140 and 60 <= vitals["blood_pressure_diastolic"] <= 90:
-        score += 0
-    else:
-        score -= 25
-    
-    # Temperature scoring
-    if 36.0 <= vitals["temperature"] <= 37.5:
-        score += 0
-    else:
-        score -= 15
-    
-    # Oxygen saturation scoring
-    if vitals["oxygen_saturation"] >= 95:
-        score += 0
-    else:
-        score -= 30
+def vitals_to_array(vitals):
+    """Stack vital readings into a (vital, reading) array; values may be scalars or arrays"""
+    return np.vstack([np.atleast_1d(np.asarray(vitals[name], dtype=float)) for name in SCORED_VITALS])
+
+def calculate_health_scores(values):
+    """Calculate health scores for a batch of readings from vitals_to_array"""
+    out_of_range = (values < VITAL_LOWER_LIMITS[:, None]) | (values > VITAL_UPPER_LIMITS[:, None])
+    heart_rate, systolic, diastolic, temperature, oxygen, glucose = out_of_range
     
-    # Blood glucose scoring
-    if 70 <= vitals["blood_glucose"] <= 140:
-        score += 0
-    else:
-        score -= 20
+    penalty = (20 * heart_rate + 25 * (systolic | diastolic) + 15 * temperature +
+               30 * oxygen + 20 * glucose)
+    return np.clip(100 - penalty, 0, 100)
+
+def assess_health_risks(values):
+    """Assess risk levels for a batch of readings from vitals_to_array"""
+    out_of_range = (values < VITAL_LOWER_LIMITS[:, None]) | (values > VITAL_UPPER_LIMITS[:, None])
+    heart_rate, systolic, _, _, oxygen, glucose = out_of_range
+    fever = values[3] > VITAL_UPPER_LIMITS[3]
     
-    return max(0, min(100, score))
+    risk_score = 3 * oxygen + 2 * systolic + 2 * heart_rate + 2 * glucose + fever
+    return np.where(risk_score >= 5, "High", np.where(risk_score >= 2, "Medium", "Low"))
+
+def calculate_health_score(vitals):
+    """Calculate overall health score based on vital signs"""
+    return int(calculate_health_scores(vitals_to_array(vitals))[0])
 
 def assess_health_risk(vitals):
     """Assess overall health risk level"""
-    risk_score = 0
-    
-    # High risk factors
-    if vitals["oxygen_saturation"] < 95:
-        risk_score += 3
-    if vitals["blood_pressure_systolic"] > 140 or vitals["blood_pressure_systolic"] < 90:
-        risk_score += 2
-    if vitals["heart_rate"] > 100 or vitals["heart_rate"] < 60:
-        risk_score += 2
-    if vitals["blood_glucose"] > 140 or vitals["blood_glucose"] < 70:
-        risk_score += 2
-    
-    # Medium risk factors
-    if vitals["temperature"] > 37.5:
-        risk_score += 1
-    
-    if risk_score >= 5:
-        return "High"
-    elif risk_score >= 2:
-        return "Medium"
-    else:
-        return "Low"
+    return str(assess_health_risks(vitals_to_array(vitals))[0])
 
 if __name__ == "__main__":
     main()
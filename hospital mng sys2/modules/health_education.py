@@ -15,6 +15,41 @@ from utils.ui_components import create_metric_card, create_alert_box, create_pro
 from utils.image_utils import create_image_display
 from config.themes import get_theme_css
 
+# Health tips by category
+HEALTH_TIPS = {
+    "General": [
+        "Drink 8 glasses of water daily",
+        "Get 7-9 hours of sleep each night",
+        "Wash your hands frequently",
+        "Take regular breaks from screens"
+    ],
+    "Cardiovascular": [
+        "Exercise for at least 30 minutes daily",
+        "Limit salt intake to 2,300mg per day",
+        "Quit smoking and avoid secondhand smoke",
+        "Monitor your blood pressure regularly"
+    ],
+    "Mental Health": [
+        "Practice mindfulness or meditation",
+        "Stay connected with friends and family",
+        "Seek professional help when needed",
+        "Maintain a regular sleep schedule"
+    ],
+    "Nutrition": [
+        "Eat a variety of colorful fruits and vegetables",
+        "Choose whole grains over refined grains",
+        "Limit processed foods and added sugars",
+        "Include lean protein in every meal"
+    ]
+}
+
+# One (category, tip, lowercased tip) row per tip, so tip search is a single flat pass
+HEALTH_TIP_ROWS = [
+    (category, tip, tip.lower())
+    for category, tips in HEALTH_TIPS.items()
+    for tip in tips
+]
+
 class HealthEducationHub:
     def __init__(self):
         self.health_topics = {
@@ -70,6 +105,12 @@ class HealthEducationHub:
             }
         }
         
+        # Lowercased topic name and description per topic, so search is one substring test
+        self.topic_search_text = {
+            topic: f"{topic}\n{info['description']}".lower()
+            for topic, info in self.health_topics.items()
+        }
+        
         self.health_quizzes = {
             "Heart Health Quiz": {
                 "questions": [
@@ -103,36 +144,9 @@ class HealthEducationHub:
     
     def get_health_tips(self, category=None):
         """Get health tips by category"""
-        tips = {
-            "General": [
-                "Drink 8 glasses of water daily",
-                "Get 7-9 hours of sleep each night",
-                "Wash your hands frequently",
-                "Take regular breaks from screens"
-            ],
-            "Cardiovascular": [
-                "Exercise for at least 30 minutes daily",
-                "Limit salt intake to 2,300mg per day",
-                "Quit smoking and avoid secondhand smoke",
-                "Monitor your blood pressure regularly"
-            ],
-            "Mental Health": [
-                "Practice mindfulness or meditation",
-                "Stay connected with friends and family",
-                "Seek professional help when needed",
-                "Maintain a regular sleep schedule"
-            ],
-            "Nutrition": [
-                "Eat a variety of colorful fruits and vegetables",
-                "Choose whole grains over refined grains",
-                "Limit processed foods and added sugars",
-                "Include lean protein in every meal"
-            ]
-        }
-        
-        if category and category in tips:
-            return tips[category]
-        return tips["General"]
+        if category and category in HEALTH_TIPS:
+            return HEALTH_TIPS[category]
+        return HEALTH_TIPS["General"]
     
     def get_article_content(self, article_title):
         """Get content for a specific article"""
@@ -274,8 +288,7 @@ def main():
         st.markdown("### 💡 Daily Health Tips")
         
         # Tip category selection
-        tip_categories = ["General", "Cardiovascular", "Mental Health", "Nutrition"]
-        selected_category = st.selectbox("Select Tip Category", tip_categories)
+        selected_category = st.selectbox("Select Tip Category", list(HEALTH_TIPS))
         
         tips = education_hub.get_health_tips(selected_category)
         
@@ -436,15 +449,20 @@ def main():
     with tab5:
         st.markdown("### 🔍 Search Health Resources")
         
-        # Search interface
-        search_term = st.text_input("Search for health topics, articles, or tips:")
+        # Search interface; the form only reruns the search when it is submitted
+        with st.form("health_search_form"):
+            search_term = st.text_input("Search for health topics, articles, or tips:")
+            st.form_submit_button("🔍 Search")
         
         if search_term:
             st.markdown(f"**Search results for '{search_term}':**")
             
+            # Lowercase the query once for every comparison below
+            term = search_term.lower()
+            
             # Search in topics
             for topic, info in education_hub.health_topics.items():
-                if search_term.lower() in topic.lower() or search_term.lower() in info["description"].lower():
+                if term in education_hub.topic_search_text[topic]:
                     with st.expander(f"📚 {topic}"):
                         st.markdown(info["description"])
                         st.markdown("**Articles:**")
@@ -452,12 +470,7 @@ def main():
                             st.markdown(f"• {article}")
             
             # Search in tips
-            all_tips = []
-            for category in ["General", "Cardiovascular", "Mental Health", "Nutrition"]:
-                tips = education_hub.get_health_tips(category)
-                for tip in tips:
-                    if search_term.lower() in tip.lower():
-                        all_tips.append((category, tip))
+            all_tips = [(category, tip) for category, tip, tip_text in HEALTH_TIP_ROWS if term in tip_text]
             
             if all_tips:
                 st.markdown("**💡 Related Tips:**")
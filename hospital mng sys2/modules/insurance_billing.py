@@ -1,6 +1,7 @@
 import streamlit as st
 import sys
 import os
+import time
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -14,6 +15,41 @@ from utils.database import db
 from utils.ui_components import create_metric_card, create_alert_box, create_progress_bar
 from config.themes import get_theme_css
 
+# Base cost and insurance coverage share for each billable service
+BILLING_CATEGORIES = {
+    "Consultation": {"base_cost": 150, "insurance_coverage": 0.8},
+    "Laboratory Tests": {"base_cost": 200, "insurance_coverage": 0.9},
+    "Imaging": {"base_cost": 300, "insurance_coverage": 0.85},
+    "Medication": {"base_cost": 100, "insurance_coverage": 0.7},
+    "Emergency Services": {"base_cost": 500, "insurance_coverage": 0.9},
+    "Surgery": {"base_cost": 5000, "insurance_coverage": 0.8}
+}
+
+# (base cost, covered amount, patient amount) per service, computed once at import
+BILLING_LINE_ITEMS = {
+    service_type: (
+        category['base_cost'],
+        category['base_cost'] * category['insurance_coverage'],
+        category['base_cost'] - category['base_cost'] * category['insurance_coverage']
+    )
+    for service_type, category in BILLING_CATEGORIES.items()
+}
+
+# Display headers for the bill detail and payment history tables, keyed by record field
+BILL_DETAIL_COLUMNS = {
+    'service': "Service",
+    'base_cost': "Base Cost",
+    'covered_amount': "Insurance Coverage",
+    'patient_amount': "Patient Amount"
+}
+PAYMENT_HISTORY_COLUMNS = {'date': "Date", 'service': "Service", 'amount': "Amount", 'status': "Status"}
+
+# Accepted payment methods listed on the payment processing tab
+PAYMENT_METHODS = [
+    "💳 Visa", "💳 Mastercard", "💳 American Express", "💳 Discover",
+    "🏦 Bank Transfer", "💰 Cash", "🏥 Insurance"
+]
+
 class InsuranceBillingAssistant:
     def __init__(self):
         self.insurance_providers = [
@@ -25,14 +61,7 @@ class InsuranceBillingAssistant:
             "Kaiser Permanente"
         ]
         
-        self.billing_categories = {
-            "Consultation": {"base_cost": 150, "insurance_coverage": 0.8},
-            "Laboratory Tests": {"base_cost": 200, "insurance_coverage": 0.9},
-            "Imaging": {"base_cost": 300, "insurance_coverage": 0.85},
-            "Medication": {"base_cost": 100, "insurance_coverage": 0.7},
-            "Emergency Services": {"base_cost": 500, "insurance_coverage": 0.9},
-            "Surgery": {"base_cost": 5000, "insurance_coverage": 0.8}
-        }
+        self.billing_categories = BILLING_CATEGORIES
     
     def verify_insurance(self, patient_id, insurance_provider, policy_number):
         """Verify patient's insurance coverage"""
@@ -58,25 +87,22 @@ class InsuranceBillingAssistant:
         bill_details = []
         
         for service in services:
-            if service['type'] in self.billing_categories:
-                category = self.billing_categories[service['type']]
-                base_cost = category['base_cost']
-                coverage = category['insurance_coverage']
-                
-                # Apply insurance coverage
-                covered_amount = base_cost * coverage
-                patient_amount = base_cost - covered_amount
-                
-                total_bill += base_cost
-                insurance_coverage += covered_amount
-                patient_responsibility += patient_amount
-                
-                bill_details.append({
-                    'service': service['type'],
-                    'base_cost': base_cost,
-                    'covered_amount': covered_amount,
-                    'patient_amount': patient_amount
-                })
+            line_item = BILLING_LINE_ITEMS.get(service['type'])
+            if line_item is None:
+                continue
+            
+            base_cost, covered_amount, patient_amount = line_item
+            
+            total_bill += base_cost
+            insurance_coverage += covered_amount
+            patient_responsibility += patient_amount
+            
+            bill_details.append({
+                'service': service['type'],
+                'base_cost': base_cost,
+                'covered_amount': covered_amount,
+                'patient_amount': patient_amount
+            })
         
         return {
             'total_bill': total_bill,
@@ -116,7 +142,7 @@ class InsuranceBillingAssistant:
         # Simulate payment processing
         payment_result = {
             'success': True,
-            'transaction_id': f"TXN_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            'transaction_id': f"TXN_{time.time_ns()}",
             'amount': amount,
             'payment_method': payment_method,
             'timestamp': datetime.now().isoformat()
@@ -124,6 +150,132 @@ class InsuranceBillingAssistant:
         
         return payment_result
 
+@st.fragment
+def render_billing_calculator(billing_assistant):
+    """Render the billing calculator tab, rerunning only this tab on interaction"""
+    
+    # Service selection
+    st.markdown("#### Select Services")
+    
+    selected_services = []
+    
+    for service_type in billing_assistant.billing_categories.keys():
+        if st.checkbox(f"✅ {service_type}", key=f"service_{service_type}"):
+            selected_services.append({
+                'type': service_type,
+                'quantity': st.number_input(f"Quantity for {service_type}", min_value=1, value=1, key=f"qty_{service_type}")
+            })
+    
+    if selected_services:
+        # Calculate bill, reusing the last result while the selected services are unchanged
+        bill_key = tuple((service['type'], service['quantity']) for service in selected_services)
+        cached_bill = st.session_state.get('billing_calculator_cache')
+        
+        if cached_bill and cached_bill[0] == bill_key:
+            bill_result, details_df = cached_bill[1], cached_bill[2]
+        else:
+            bill_result = billing_assistant.calculate_bill("patient_001", selected_services)
+            
+            details_df = pd.DataFrame(bill_result['details'], columns=list(BILL_DETAIL_COLUMNS))
+            amount_columns = ['base_cost', 'covered_amount', 'patient_amount']
+            details_df[amount_columns] = "$" + details_df[amount_columns].astype(str)
+            details_df = details_df.rename(columns=BILL_DETAIL_COLUMNS)
+            st.session_state['billing_calculator_cache'] = (bill_key, bill_result, details_df)
+        
+        st.markdown("#### 📊 Bill Summary")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            create_metric_card("Total Bill", f"${bill_result['total_bill']}", "💰")
+        
+        with col2:
+            create_metric_card("Insurance Coverage", f"${bill_result['insurance_coverage']}", "🏥")
+        
+        with col3:
+            create_metric_card("Patient Responsibility", f"${bill_result['patient_responsibility']}", "💳")
+        
+        # Bill details
+        st.markdown("#### 📋 Bill Details")
+        st.dataframe(details_df, use_container_width=True)
+        
+        # Payment options
+        st.markdown("#### 💳 Payment Options")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("💳 Pay Now"):
+                st.info("Redirecting to payment gateway...")
+        
+        with col2:
+            if st.button("📧 Send Bill"):
+                st.success("✅ Bill sent to patient email!")
+        
+        with col3:
+            if st.button("📄 Download Bill"):
+                st.success("✅ Bill downloaded successfully!")
+
+@st.fragment
+def render_billing_history(billing_assistant, patient_labels):
+    """Render the billing history tab, rerunning only this tab on interaction"""
+    
+    # Patient selection for history
+    patient_id = st.selectbox(
+        "Select Patient for History", list(patient_labels), format_func=patient_labels.get, key="history_patient"
+    )
+    
+    if patient_id:
+        
+        # Get payment history
+        payment_history = billing_assistant.get_payment_history(patient_id)
+        
+        if payment_history:
+            # Payment history statistics
+            st.markdown("#### 📊 Payment Statistics")
+            
+            total_paid = sum(payment['amount'] for payment in payment_history)
+            total_payments = len(payment_history)
+            avg_payment = total_paid / total_payments if total_payments > 0 else 0
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                create_metric_card("Total Paid", f"${total_paid}", "💰")
+            
+            with col2:
+                create_metric_card("Total Payments", total_payments, "💳")
+            
+            with col3:
+                create_metric_card("Average Payment", f"${avg_payment:.2f}", "📊")
+            
+            # Payment history table
+            st.markdown("#### 📋 Payment History")
+            
+            history_df = pd.DataFrame(payment_history, columns=list(PAYMENT_HISTORY_COLUMNS))
+            history_df['amount'] = "$" + history_df['amount'].astype(str)
+            history_df = history_df.rename(columns=PAYMENT_HISTORY_COLUMNS)
+            st.dataframe(history_df, use_container_width=True)
+            
+            # Export options
+            st.markdown("#### 📤 Export Options")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                if st.button("📊 Export Payment History"):
+                    st.success("✅ Payment history exported!")
+            
+            with col2:
+                if st.button("📄 Generate Statement"):
+                    st.success("✅ Statement generated!")
+            
+            with col3:
+                if st.button("📧 Email Statement"):
+                    st.success("✅ Statement sent to email!")
+        else:
+            st.info("📋 No payment history found for this patient.")
+
 def main():
     """Main function for Insurance & Billing Assistant module"""
     
@@ -161,11 +313,10 @@ def main():
             st.error("No patients found in the system")
             return
         
-        patient_names = [f"{p['name']} (ID: {p['id']})" for p in patients]
-        selected_patient = st.selectbox("Select Patient", patient_names)
+        patient_labels = {p['id']: f"{p['name']} (ID: {p['id']})" for p in patients}
+        patient_id = st.selectbox("Select Patient", list(patient_labels), format_func=patient_labels.get)
         
-        if selected_patient:
-            patient_id = selected_patient.split("(ID: ")[1].split(")")[0]
+        if patient_id:
             
             # Insurance verification form
             with st.form("insurance_verification"):
@@ -230,70 +381,7 @@ def main():
     
     with tab2:
         st.markdown("### 💰 Billing Calculator")
-        
-        # Service selection
-        st.markdown("#### Select Services")
-        
-        selected_services = []
-        
-        for service_type in billing_assistant.billing_categories.keys():
-            if st.checkbox(f"✅ {service_type}", key=f"service_{service_type}"):
-                selected_services.append({
-                    'type': service_type,
-                    'quantity': st.number_input(f"Quantity for {service_type}", min_value=1, value=1, key=f"qty_{service_type}")
-                })
-        
-        if selected_services:
-            # Calculate bill
-            bill_result = billing_assistant.calculate_bill("patient_001", selected_services)
-            
-            st.markdown("#### 📊 Bill Summary")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                create_metric_card("Total Bill", f"${bill_result['total_bill']}", "💰")
-            
-            with col2:
-                create_metric_card("Insurance Coverage", f"${bill_result['insurance_coverage']}", "🏥")
-            
-            with col3:
-                create_metric_card("Patient Responsibility", f"${bill_result['patient_responsibility']}", "💳")
-            
-            # Bill details
-            st.markdown("#### 📋 Bill Details")
-            
-            details_data = []
-            for detail in bill_result['details']:
-                details_data.append([
-                    detail['service'],
-                    f"${detail['base_cost']}",
-                    f"${detail['covered_amount']}",
-                    f"${detail['patient_amount']}"
-                ])
-            
-            details_df = pd.DataFrame(
-                details_data, 
-                columns=["Service", "Base Cost", "Insurance Coverage", "Patient Amount"]
-            )
-            st.dataframe(details_df, use_container_width=True)
-            
-            # Payment options
-            st.markdown("#### 💳 Payment Options")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                if st.button("💳 Pay Now"):
-                    st.info("Redirecting to payment gateway...")
-            
-            with col2:
-                if st.button("📧 Send Bill"):
-                    st.success("✅ Bill sent to patient email!")
-            
-            with col3:
-                if st.button("📄 Download Bill"):
-                    st.success("✅ Bill downloaded successfully!")
+        render_billing_calculator(billing_assistant)
     
     with tab3:
         st.markdown("### 💳 Payment Processing")
@@ -370,84 +458,17 @@ def main():
         # Payment methods info
         st.markdown("#### 💳 Accepted Payment Methods")
         
-        payment_methods = [
-            "💳 Visa", "💳 Mastercard", "💳 American Express", "💳 Discover",
-            "🏦 Bank Transfer", "💰 Cash", "🏥 Insurance"
-        ]
-        
-        cols = st.columns(4)
-        for i, method in enumerate(payment_methods):
-            with cols[i % 4]:
-                st.markdown(f"• {method}")
+        # One four-column CSS grid instead of a column container and markdown element per method
+        st.markdown(
+            '<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 8px;">'
+            + "".join(f"<div>• {method}</div>" for method in PAYMENT_METHODS)
+            + "</div>",
+            unsafe_allow_html=True
+        )
     
     with tab4:
         st.markdown("### 📊 Billing History")
-        
-        # Patient selection for history
-        patient_names = [f"{p['name']} (ID: {p['id']})" for p in patients]
-        selected_patient_history = st.selectbox("Select Patient for History", patient_names, key="history_patient")
-        
-        if selected_patient_history:
-            patient_id = selected_patient_history.split("(ID: ")[1].split(")")[0]
-            
-            # Get payment history
-            payment_history = billing_assistant.get_payment_history(patient_id)
-            
-            if payment_history:
-                # Payment history statistics
-                st.markdown("#### 📊 Payment Statistics")
-                
-                total_paid = sum(payment['amount'] for payment in payment_history)
-                total_payments = len(payment_history)
-                avg_payment = total_paid / total_payments if total_payments > 0 else 0
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    create_metric_card("Total Paid", f"${total_paid}", "💰")
-                
-                with col2:
-                    create_metric_card("Total Payments", total_payments, "💳")
-                
-                with col3:
-                    create_metric_card("Average Payment", f"${avg_payment:.2f}", "📊")
-                
-                # Payment history table
-                st.markdown("#### 📋 Payment History")
-                
-                history_data = []
-                for payment in payment_history:
-                    history_data.append([
-                        payment['date'],
-                        payment['service'],
-                        f"${payment['amount']}",
-                        payment['status']
-                    ])
-                
-                history_df = pd.DataFrame(
-                    history_data,
-                    columns=["Date", "Service", "Amount", "Status"]
-                )
-                st.dataframe(history_df, use_container_width=True)
-                
-                # Export options
-                st.markdown("#### 📤 Export Options")
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    if st.button("📊 Export Payment History"):
-                        st.success("✅ Payment history exported!")
-                
-                with col2:
-                    if st.button("📄 Generate Statement"):
-                        st.success("✅ Statement generated!")
-                
-                with col3:
-                    if st.button("📧 Email Statement"):
-                        st.success("✅ Statement sent to email!")
-            else:
-                st.info("📋 No payment history found for this patient.")
+        render_billing_history(billing_assistant, patient_labels)
 
 if __name__ == "__main__":
     main()
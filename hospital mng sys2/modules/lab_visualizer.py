@@ -5,6 +5,7 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from operator import itemgetter
 import plotly.express as px
 
 # Add parent directory to path for imports
@@ -12,7 +13,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.auth import check_authentication
 from utils.database import db
-from utils.ui_components import create_metric_card, create_alert_box
+from utils.ui_components import create_metric_card, create_alert_boxes
 from config.themes import get_theme_css
 
 class LabReportVisualizer:
@@ -87,12 +88,15 @@ def main():
         st.error("No patients found in the system")
         return
     
-    patient_names = [f"{p['name']} (ID: {p['id']})" for p in patients]
-    selected_patient = st.selectbox("Select Patient", patient_names)
+    patients_by_id = {p['id']: p for p in patients}
+    patient_id = st.selectbox(
+        "Select Patient",
+        list(patients_by_id),
+        format_func=lambda pid: f"{patients_by_id[pid]['name']} (ID: {pid})"
+    )
     
-    if selected_patient:
-        patient_id = selected_patient.split("(ID: ")[1].split(")")[0]
-        patient = next((p for p in patients if p['id'] == patient_id), None)
+    if patient_id:
+        patient = patients_by_id[patient_id]
         
         if patient:
             # Display patient info
@@ -124,7 +128,7 @@ def main():
                     create_metric_card("Abnormal Values", total_abnormal, "⚠️")
                 
                 with col3:
-                    recent_report = max(lab_reports, key=lambda x: x['date'])
+                    recent_report = max(lab_reports, key=itemgetter('date'))
                     create_metric_card("Latest Report", recent_report['test_type'][:20] + "...", "🆕")
                 
                 with col4:
@@ -174,10 +178,11 @@ def main():
                         # Abnormal values
                         if report['abnormal_values']:
                             st.markdown("**⚠️ Abnormal Values:**")
-                            for abnormal in report['abnormal_values']:
-                                alert_type = "error" if abnormal['status'] in ['High', 'Low'] else "warning"
-                                alert_message = f"**{abnormal['test']}**: {abnormal['value']:.2f} ({abnormal['status']}) - Normal: {abnormal['normal_range']}"
-                                create_alert_box(alert_message, alert_type)
+                            create_alert_boxes([
+                                (f"**{abnormal['test']}**: {abnormal['value']:.2f} ({abnormal['status']}) - Normal: {abnormal['normal_range']}",
+                                 "error" if abnormal['status'] in ['High', 'Low'] else "warning")
+                                for abnormal in report['abnormal_values']
+                            ])
                 
                 # Export option
                 if st.button("📊 Export Lab Reports"):
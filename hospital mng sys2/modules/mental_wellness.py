@@ -1,10 +1,11 @@
 import streamlit as st
 import sys
 import os
+import time
 from pathlib import Path
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import plotly.express as px
 import plotly.graph_objects as go
 
@@ -17,6 +18,69 @@ from utils.ui_components import create_metric_card, create_alert_box, create_pro
 from utils.voice_utils import voice_assistant
 from config.themes import get_theme_css
 
+# Guided meditation scripts by type
+MEDITATION_GUIDES = {
+    "Mindfulness": {
+        "duration": "10 minutes",
+        "steps": [
+            "Find a comfortable sitting position",
+            "Close your eyes and take deep breaths",
+            "Focus on your breath - inhale and exhale",
+            "When thoughts arise, gently return to breath",
+            "Continue for 10 minutes"
+        ],
+        "benefits": ["Reduces stress", "Improves focus", "Enhances self-awareness"]
+    },
+    "Breathing": {
+        "duration": "5 minutes",
+        "steps": [
+            "Sit comfortably with your back straight",
+            "Place one hand on your chest, one on your belly",
+            "Breathe in for 4 counts",
+            "Hold for 4 counts",
+            "Breathe out for 6 counts",
+            "Repeat the cycle"
+        ],
+        "benefits": ["Calms nervous system", "Reduces anxiety", "Improves sleep"]
+    },
+    "Body Scan": {
+        "duration": "15 minutes",
+        "steps": [
+            "Lie down in a comfortable position",
+            "Start from your toes, notice any sensations",
+            "Move attention up through your body",
+            "Scan each part: legs, torso, arms, head",
+            "Release tension as you go"
+        ],
+        "benefits": ["Reduces body tension", "Improves body awareness", "Promotes relaxation"]
+    }
+}
+
+# Wellness tips and resources by category
+WELLNESS_RESOURCES = {
+    "Daily Tips": [
+        "Practice gratitude - write 3 things you're thankful for",
+        "Take regular breaks from screens",
+        "Connect with loved ones daily",
+        "Get adequate sleep (7-9 hours)",
+        "Exercise regularly, even just a short walk"
+    ],
+    "Coping Strategies": [
+        "Deep breathing exercises",
+        "Progressive muscle relaxation",
+        "Mindful walking",
+        "Journaling your thoughts",
+        "Listening to calming music"
+    ],
+    "Professional Help": [
+        "Talk to your doctor about mental health",
+        "Consider therapy or counseling",
+        "Join support groups",
+        "Use crisis helplines if needed",
+        "Practice self-compassion"
+    ]
+}
+
 class MentalWellnessCompanion:
     def __init__(self):
         self.mood_options = [
@@ -34,7 +98,7 @@ class MentalWellnessCompanion:
     def track_mood(self, patient_id, mood, stress_level, notes=""):
         """Track patient's mood and stress level"""
         mood_entry = {
-            'id': f"mood_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            'id': f"mood_{time.time_ns()}",
             'patient_id': patient_id,
             'date': datetime.now().isoformat(),
             'mood': mood,
@@ -47,19 +111,20 @@ class MentalWellnessCompanion:
     
     def get_mood_history(self, patient_id, days=30):
         """Get patient's mood history"""
-        # Simulate mood history data
-        mood_history = []
+        # Simulate mood history data, drawing every day's mood and stress level at once
+        dates = pd.date_range(end=datetime.now(), periods=days)[::-1]
+        moods = np.random.choice(self.mood_options, size=days)
+        stress_levels = np.random.choice(self.stress_levels, size=days)
         
-        for i in range(days):
-            date = datetime.now() - timedelta(days=i)
-            mood_history.append({
+        return [
+            {
                 'date': date.isoformat(),
-                'mood': np.random.choice(self.mood_options),
-                'stress_level': np.random.choice(self.stress_levels),
+                'mood': mood,
+                'stress_level': stress_level,
                 'notes': f"Day {i+1} mood entry"
-            })
-        
-        return mood_history
+            }
+            for i, (date, mood, stress_level) in enumerate(zip(dates, moods.tolist(), stress_levels.tolist()))
+        ]
     
     def analyze_mood_trends(self, mood_history):
         """Analyze mood and stress trends"""
@@ -86,44 +151,7 @@ class MentalWellnessCompanion:
     
     def get_meditation_guide(self, meditation_type):
         """Get meditation guide for specific type"""
-        guides = {
-            "Mindfulness": {
-                "duration": "10 minutes",
-                "steps": [
-                    "Find a comfortable sitting position",
-                    "Close your eyes and take deep breaths",
-                    "Focus on your breath - inhale and exhale",
-                    "When thoughts arise, gently return to breath",
-                    "Continue for 10 minutes"
-                ],
-                "benefits": ["Reduces stress", "Improves focus", "Enhances self-awareness"]
-            },
-            "Breathing": {
-                "duration": "5 minutes",
-                "steps": [
-                    "Sit comfortably with your back straight",
-                    "Place one hand on your chest, one on your belly",
-                    "Breathe in for 4 counts",
-                    "Hold for 4 counts",
-                    "Breathe out for 6 counts",
-                    "Repeat the cycle"
-                ],
-                "benefits": ["Calms nervous system", "Reduces anxiety", "Improves sleep"]
-            },
-            "Body Scan": {
-                "duration": "15 minutes",
-                "steps": [
-                    "Lie down in a comfortable position",
-                    "Start from your toes, notice any sensations",
-                    "Move attention up through your body",
-                    "Scan each part: legs, torso, arms, head",
-                    "Release tension as you go"
-                ],
-                "benefits": ["Reduces body tension", "Improves body awareness", "Promotes relaxation"]
-            }
-        }
-        
-        return guides.get(meditation_type, guides["Mindfulness"])
+        return MEDITATION_GUIDES.get(meditation_type, MEDITATION_GUIDES["Mindfulness"])
     
     def assess_stress_level(self, responses):
         """Assess stress level based on questionnaire responses"""
@@ -141,31 +169,7 @@ class MentalWellnessCompanion:
     
     def get_wellness_resources(self):
         """Get wellness resources and tips"""
-        resources = {
-            "Daily Tips": [
-                "Practice gratitude - write 3 things you're thankful for",
-                "Take regular breaks from screens",
-                "Connect with loved ones daily",
-                "Get adequate sleep (7-9 hours)",
-                "Exercise regularly, even just a short walk"
-            ],
-            "Coping Strategies": [
-                "Deep breathing exercises",
-                "Progressive muscle relaxation",
-                "Mindful walking",
-                "Journaling your thoughts",
-                "Listening to calming music"
-            ],
-            "Professional Help": [
-                "Talk to your doctor about mental health",
-                "Consider therapy or counseling",
-                "Join support groups",
-                "Use crisis helplines if needed",
-                "Practice self-compassion"
-            ]
-        }
-        
-        return resources
+        return WELLNESS_RESOURCES
 
 def main():
     """Main function for Mental Wellness Companion module"""
@@ -251,12 +255,10 @@ def main():
                 st.markdown(f"**Duration:** {guide['duration']}")
                 
                 st.markdown("**Steps:**")
-                for i, step in enumerate(guide['steps'], 1):
-                    st.markdown(f"{i}. {step}")
+                st.markdown("\n".join(f"{i}. {step}" for i, step in enumerate(guide['steps'], 1)))
                 
                 st.markdown("**Benefits:**")
-                for benefit in guide['benefits']:
-                    st.markdown(f"• {benefit}")
+                st.markdown("  \n".join(f"• {benefit}" for benefit in guide['benefits']))
             
             with col2:
                 # Meditation timer
@@ -371,11 +373,11 @@ def main():
             
             # Recommendations based on stress level
             if stress_level in ["High", "Very High"]:
-                st.markdown("**Immediate Recommendations:**")
-                st.markdown("• Practice deep breathing exercises")
-                st.markdown("• Take short breaks throughout the day")
-                st.markdown("• Consider talking to a mental health professional")
-                st.markdown("• Engage in physical activity")
+                st.markdown("**Immediate Recommendations:**  \n"
+                            "• Practice deep breathing exercises  \n"
+                            "• Take short breaks throughout the day  \n"
+                            "• Consider talking to a mental health professional  \n"
+                            "• Engage in physical activity")
     
     with tab5:
         st.markdown("### 💡 Wellness Resources")
@@ -386,18 +388,15 @@ def main():
         
         with col1:
             st.markdown("#### 🌟 Daily Tips")
-            for tip in resources["Daily Tips"]:
-                st.markdown(f"• {tip}")
+            st.markdown("  \n".join(f"• {tip}" for tip in resources["Daily Tips"]))
         
         with col2:
             st.markdown("#### 🛠️ Coping Strategies")
-            for strategy in resources["Coping Strategies"]:
-                st.markdown(f"• {strategy}")
+            st.markdown("  \n".join(f"• {strategy}" for strategy in resources["Coping Strategies"]))
         
         with col3:
             st.markdown("#### 🆘 Professional Help")
-            for help_option in resources["Professional Help"]:
-                st.markdown(f"• {help_option}")
+            st.markdown("  \n".join(f"• {help_option}" for help_option in resources["Professional Help"]))
         
         # Crisis resources
         st.markdown("### 🆘 Crisis Resources")
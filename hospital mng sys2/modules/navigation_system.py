@@ -14,6 +14,23 @@ from utils.database import db
 from utils.ui_components import create_metric_card, create_alert_box
 from config.themes import get_theme_css
 
+# Floor index used for route distance calculations
+FLOOR_LEVELS = {
+    "Ground Floor": 0,
+    "First Floor": 1,
+    "Second Floor": 2,
+    "Third Floor": 3
+}
+
+# Departments offered as one-click searches
+QUICK_SEARCH_DEPARTMENTS = [("🏥", "Emergency"), ("💊", "Pharmacy"), ("🩺", "Reception")]
+
+# Departments listed under Quick Access
+POPULAR_DESTINATIONS = [
+    ("🏥", "Emergency"), ("💊", "Pharmacy"), ("🩺", "Reception"),
+    ("🍽️", "Cafeteria"), ("🛏️", "General Ward"), ("👶", "Pediatrics")
+]
+
 class SmartNavigationSystem:
     def __init__(self):
         self.hospital_floors = {
@@ -57,58 +74,60 @@ class SmartNavigationSystem:
             "patient_002": {"floor": "Third Floor", "ward": "Pediatrics", "room": "Room 711"},
             "patient_003": {"floor": "Second Floor", "ward": "ICU", "room": "Room 651"}
         }
+        
+        self.department_locations = {
+            dept: (floor, rooms)
+            for floor, departments in self.hospital_floors.items()
+            for dept, rooms in departments.items()
+        }
+        self.location_index = self.build_location_index()
     
-    def find_location(self, search_term):
-        """Find location of department, doctor, or patient"""
-        results = []
+    def build_location_index(self):
+        """Build a (lowercase name, result) index of departments, doctors and patients"""
+        index = []
         
-        # Search in departments
+        # Departments
         for floor, departments in self.hospital_floors.items():
             for dept, rooms in departments.items():
-                if search_term.lower() in dept.lower():
-                    results.append({
-                        'type': 'Department',
-                        'name': dept,
-                        'floor': floor,
-                        'location': rooms
-                    })
-        
-        # Search in doctors
+                index.append((dept.lower(), {
+                    'type': 'Department',
+                    'name': dept,
+                    'floor': floor,
+                    'location': rooms
+                }))
+        
+        # Doctors
         for doctor, location in self.doctors_locations.items():
-            if search_term.lower() in doctor.lower():
-                results.append({
-                    'type': 'Doctor',
-                    'name': doctor,
-                    'floor': location['floor'],
-                    'location': location['room']
-                })
-        
-        # Search in patients
+            index.append((doctor.lower(), {
+                'type': 'Doctor',
+                'name': doctor,
+                'floor': location['floor'],
+                'location': location['room']
+            }))
+        
+        # Patients
         for patient_id, location in self.patients_locations.items():
-            if search_term.lower() in patient_id.lower():
-                results.append({
-                    'type': 'Patient',
-                    'name': patient_id,
-                    'floor': location['floor'],
-                    'location': location['room']
-                })
-        
-        return results
+            index.append((patient_id.lower(), {
+                'type': 'Patient',
+                'name': patient_id,
+                'floor': location['floor'],
+                'location': location['room']
+            }))
+        
+        return index
+    
+    def find_location(self, search_term):
+        """Find location of department, doctor, or patient"""
+        term = search_term.lower()
+        return [result for name, result in self.location_index if term in name]
     
     def get_route(self, from_location, to_location):
         """Get route between two locations"""
         # Simple route calculation
-        routes = {
-            "Ground Floor": 0,
-            "First Floor": 1,
-            "Second Floor": 2,
-            "Third Floor": 3
-        }
-        
         from_floor = from_location.get('floor', 'Ground Floor')
         to_floor = to_location.get('floor', 'Ground Floor')
         
-        floor_diff = abs(routes.get(from_floor, 0) - routes.get(to_floor, 0))
+        floor_diff = abs(FLOOR_LEVELS.get(from_floor, 0) - FLOOR_LEVELS.get(to_floor, 0))
         
         route_steps = []
         
@@ -170,8 +189,10 @@ def main():
     with tab1:
         st.markdown("### 🔍 Location Search")
         
-        # Search interface
-        search_term = st.text_input("Search for department, doctor, or patient:")
+        # Search interface; the form only reruns the search when it is submitted
+        with st.form("location_search_form"):
+            search_term = st.text_input("Search for department, doctor, or patient:")
+            st.form_submit_button("🔍 Search")
         
         if search_term:
             results = nav_system.find_location(search_term)
@@ -198,25 +219,12 @@ def main():
         # Quick search options
         st.markdown("### 🚀 Quick Search")
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button("🏥 Emergency"):
-                results = nav_system.find_location("Emergency")
-                if results:
-                    st.success(f"Emergency: {results[0]['floor']} - {results[0]['location']}")
-        
-        with col2:
-            if st.button("💊 Pharmacy"):
-                results = nav_system.find_location("Pharmacy")
-                if results:
-                    st.success(f"Pharmacy: {results[0]['floor']} - {results[0]['location']}")
-        
-        with col3:
-            if st.button("🩺 Reception"):
-                results = nav_system.find_location("Reception")
-                if results:
-                    st.success(f"Reception: {results[0]['floor']} - {results[0]['location']}")
+        cols = st.columns(len(QUICK_SEARCH_DEPARTMENTS))
+        for col, (icon, department) in zip(cols, QUICK_SEARCH_DEPARTMENTS):
+            with col:
+                if st.button(f"{icon} {department}"):
+                    floor, rooms = nav_system.department_locations[department]
+                    st.success(f"{department}: {floor} - {rooms}")
     
     with tab2:
         st.markdown("### 🗺️ Floor Maps")
@@ -303,12 +311,8 @@ def main():
         st.markdown("#### 🎯 Popular Destinations")
         
         destinations = [
-            ("🏥 Emergency", "Ground Floor - Room 101-110"),
-            ("💊 Pharmacy", "Ground Floor - Room 201-205"),
-            ("🩺 Reception", "Ground Floor - Room 001-005"),
-            ("🍽️ Cafeteria", "Ground Floor - Room 301-305"),
-            ("🛏️ General Ward", "Second Floor - Room 601-650"),
-            ("👶 Pediatrics", "Third Floor - Room 711-730")
+            (f"{icon} {department}", " - ".join(nav_system.department_locations[department]))
+            for icon, department in POPULAR_DESTINATIONS
         ]
         
         cols = st.columns(2)
@@ -1,6 +1,7 @@
 import streamlit as st
 import sys
 import os
+import json
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -111,8 +112,8 @@ class PrescriptionSystem:
             "created_at": prescription_data["created_at"]
         }
         
-        import json
-        return json.dumps(qr_data)
+        # Compact separators keep the payload, and so the QR version, as small as possible
+        return json.dumps(qr_data, separators=(",", ":"))
     
     def check_medication_availability(self, medication_id, quantity):
         """Check if medication is available in pharmacy"""
@@ -203,8 +204,8 @@ def main():
             # Doctor selection
             doctors = db.doctors
             doctor_options = [f"{doc['name']} - {doc['specialization']}" for doc in doctors]
-            selected_doctor = st.selectbox("Select Doctor", doctor_options)
-            doctor_id = doctors[doctor_options.index(selected_doctor)]["id"]
+            selected_doctor = st.selectbox("Select Doctor", range(len(doctors)), format_func=doctor_options.__getitem__)
+            doctor_id = doctors[selected_doctor]["id"]
             
             # Diagnosis
             diagnosis = st.text_input("Diagnosis", placeholder="Enter diagnosis...")
@@ -215,6 +216,9 @@ def main():
             medications = []
             num_medications = st.number_input("Number of medications", min_value=1, max_value=10, value=1)
             
+            # Option labels are shared by every medication row, so build them once
+            medication_options = [f"{med['name']} ({med['generic_name']})" for med in prescription_system.medications]
+            
             for i in range(num_medications):
                 st.markdown(f"**Medication {i+1}**")
                 
@@ -222,11 +226,13 @@ def main():
                 
                 with col1:
                     # Medication selection
-                    medication_options = [f"{med['name']} ({med['generic_name']})" for med in prescription_system.medications]
-                    selected_med = st.selectbox(f"Medication {i+1}", medication_options, key=f"med_{i}")
+                    selected_med = st.selectbox(
+                        f"Medication {i+1}", range(len(medication_options)),
+                        format_func=medication_options.__getitem__, key=f"med_{i}"
+                    )
                     
                     # Get selected medication
-                    selected_medication = prescription_system.medications[medication_options.index(selected_med)]
+                    selected_medication = prescription_system.medications[selected_med]
                     
                     # Dosage form
                     dosage_form = st.selectbox("Dosage Form", selected_medication["dosage_forms"], key=f"dosage_{i}")
@@ -403,9 +409,11 @@ def main():
         col1, col2 = st.columns([1, 2])
         
         with col1:
-            st.markdown(f"**{medication['name']}**")
-            st.write(f"Category: {medication['category']}")
-            st.write(f"Generic: {medication['generic_name']}")
+            st.markdown(
+                f"**{medication['name']}**\n\n"
+                f"| Category | Generic |\n|---|---|\n"
+                f"| {medication['category']} | {medication['generic_name']} |"
+            )
         
         with col2:
             image_url = create_image_url_input(
@@ -418,39 +426,43 @@ def main():
             else:
                 create_medicine_image_display(medication['name'])
 
+@st.cache_data(max_entries=32)
+def build_prescription_charts(prescription_dates, medication_names):
+    """Build the monthly trend and most-prescribed charts from date and medication name tuples"""
+    # Monthly prescription trend
+    dates = pd.Series(pd.to_datetime(list(prescription_dates)))
+    monthly_prescriptions = dates.groupby(dates.dt.to_period('M')).size().reset_index(name='count')
+    monthly_prescriptions.columns = ['date', 'count']
+    monthly_prescriptions['date'] = monthly_prescriptions['date'].astype(str)
+    
+    fig = px.line(monthly_prescriptions, x='date', y='count', title='Monthly Prescription Trend', height=300)
+    
+    # Most prescribed medications
+    fig2 = None
+    if medication_names:
+        medication_counts = pd.Series(medication_names).value_counts()
+        
+        fig2 = px.bar(
+            x=medication_counts.index,
+            y=medication_counts.values,
+            title="Most Prescribed Medications",
+            height=300
+        )
+    return fig, fig2
+
 def create_prescription_analytics():
     """Create prescription analytics dashboard"""
     st.markdown("### 📈 Prescription Analytics")
     
-    # Get prescription data
-    prescriptions_df = pd.DataFrame(db.prescriptions)
-    
-    if not prescriptions_df.empty:
-        # Convert date column
-        prescriptions_df['date'] = pd.to_datetime(prescriptions_df['date'])
-        
-        # Monthly prescription trend
-        monthly_prescriptions = prescriptions_df.groupby(prescriptions_df['date'].dt.to_period('M')).size().reset_index(name='count')
+    if db.prescriptions:
+        prescription_dates = tuple(prescription['date'] for prescription in db.prescriptions)
+        medication_names = tuple(
+            med['name'] for prescription in db.prescriptions for med in prescription['medications']
+        )
+        fig, fig2 = build_prescription_charts(prescription_dates, medication_names)
         
-        fig = px.line(monthly_prescriptions, x='date', y='count', title='Monthly Prescription Trend')
-        fig.update_layout(height=300)
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Most prescribed medications
-        all_medications = []
-        for prescription in db.prescriptions:
-            for med in prescription['medications']:
-                all_medications.append(med['name'])
-        
-        if all_medications:
-            medication_counts = pd.Series(all_medications).value_counts()
-            
-            fig2 = px.bar(
-                x=medication_counts.index,
-                y=medication_counts.values,
-                title="Most Prescribed Medications"
-            )
-            fig2.update_layout(height=300)
+        if fig2 is not None:
             st.plotly_chart(fig2, use_container_width=True)
     else:
         st.info("No prescription data available for analytics.")
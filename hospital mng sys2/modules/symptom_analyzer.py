@@ -1,13 +1,10 @@
 import streamlit as st
 import sys
 import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
-import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.feature_extraction.text import TfidfVectorizer
-import plotly.graph_objects as go
-import plotly.express as px
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -18,120 +15,252 @@ from utils.voice_utils import VoiceAssistant, create_voice_input_widget
 from utils.image_utils import create_disease_image_display, create_image_url_input
 from config.themes import get_theme_css
 
+# Trained symptom model cache, next to this module regardless of the launch directory
+MODEL_CACHE_DIR = Path(__file__).parent / "models"
+
+# RandomForest settings for the symptom model
+MODEL_PARAMS = {"n_estimators": 25, "n_jobs": 1, "random_state": 42}
+
+# Symptom to candidate disease mapping used to train the model
+SYMPTOM_DISEASE_MAP = {
+    "fever": ["Common Cold", "Flu", "COVID-19", "Malaria", "Dengue"],
+    "headache": ["Migraine", "Tension Headache", "Sinusitis", "Hypertension"],
+    "cough": ["Common Cold", "Bronchitis", "Pneumonia", "COVID-19", "Asthma"],
+    "fatigue": ["Anemia", "Depression", "Chronic Fatigue Syndrome", "Diabetes"],
+    "nausea": ["Food Poisoning", "Gastritis", "Migraine", "Pregnancy"],
+    "chest_pain": ["Angina", "Heart Attack", "Pneumonia", "Anxiety"],
+    "abdominal_pain": ["Appendicitis", "Gastritis", "Food Poisoning", "Ulcer"],
+    "shortness_of_breath": ["Asthma", "Pneumonia", "Anxiety", "Heart Failure"],
+    "dizziness": ["Vertigo", "Anemia", "Low Blood Pressure", "Dehydration"],
+    "joint_pain": ["Arthritis", "Lupus", "Fibromyalgia", "Injury"]
+}
+
+# Detailed disease information shown with predictions
+DISEASE_INFO = {
+    "Common Cold": {
+        "description": "Viral infection of the upper respiratory tract",
+        "severity": "Mild",
+        "treatment": "Rest, fluids, over-the-counter medications",
+        "image_url": None,
+        "hindi_name": "सर्दी जुकाम",
+        "hindi_description": "ऊपरी श्वसन पथ का वायरल संक्रमण"
+    },
+    "Flu": {
+        "description": "Influenza virus infection affecting respiratory system",
+        "severity": "Moderate",
+        "treatment": "Rest, fluids, antiviral medications if severe",
+        "image_url": None,
+        "hindi_name": "फ्लू",
+        "hindi_description": "श्वसन प्रणाली को प्रभावित करने वाला इन्फ्लूएंजा वायरस संक्रमण"
+    },
+    "COVID-19": {
+        "description": "Coronavirus disease caused by SARS-CoV-2",
+        "severity": "Variable",
+        "treatment": "Rest, isolation, medical care if severe",
+        "image_url": None,
+        "hindi_name": "कोविड-19",
+        "hindi_description": "SARS-CoV-2 के कारण होने वाला कोरोनावायरस रोग"
+    },
+    "Diabetes": {
+        "description": "Metabolic disorder affecting blood sugar regulation",
+        "severity": "Chronic",
+        "treatment": "Diet, exercise, medication, insulin if needed",
+        "image_url": None,
+        "hindi_name": "मधुमेह",
+        "hindi_description": "रक्त शर्करा विनियमन को प्रभावित करने वाला चयापचय विकार"
+    },
+    "Hypertension": {
+        "description": "High blood pressure affecting cardiovascular system",
+        "severity": "Chronic",
+        "treatment": "Lifestyle changes, medication, regular monitoring",
+        "image_url": None,
+        "hindi_name": "उच्च रक्तचाप",
+        "hindi_description": "हृदय प्रणाली को प्रभावित करने वाला उच्च रक्तचाप"
+    }
+}
+
+# Symptom input methods
+INPUT_METHODS = ("Manual Selection", "Voice Input", "Body Map Selection")
+
+# Body map areas and the symptoms offered for each
+BODY_AREAS = ("Head", "Chest", "Abdomen", "Arms", "Legs", "Back")
+BODY_AREA_SYMPTOMS = {
+    "Head": ("headache", "dizziness", "fever"),
+    "Chest": ("chest_pain", "shortness_of_breath", "cough"),
+    "Abdomen": ("abdominal_pain", "nausea", "fatigue")
+}
+
 class SymptomAnalyzer:
     def __init__(self):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
         self.symptoms_data = self.load_symptoms_data()
         self.diseases_data = self.load_diseases_data()
-        self.model = self.train_model()
+        self.model = self.load_or_train_model()
         self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        self.symptom_vectors = self.build_symptom_vectors()
+        # Reruns repeat the same free text, so keep recent query vectors per analyzer
+        self.transform_queries = lru_cache(maxsize=128)(self.transform_queries)
         
     def load_symptoms_data(self):
         """Load symptoms and disease mapping data"""
-        return {
-            "fever": ["Common Cold", "Flu", "COVID-19", "Malaria", "Dengue"],
-            "headache": ["Migraine", "Tension Headache", "Sinusitis", "Hypertension"],
-            "cough": ["Common Cold", "Bronchitis", "Pneumonia", "COVID-19", "Asthma"],
-            "fatigue": ["Anemia", "Depression", "Chronic Fatigue Syndrome", "Diabetes"],
-            "nausea": ["Food Poisoning", "Gastritis", "Migraine", "Pregnancy"],
-            "chest_pain": ["Angina", "Heart Attack", "Pneumonia", "Anxiety"],
-            "abdominal_pain": ["Appendicitis", "Gastritis", "Food Poisoning", "Ulcer"],
-            "shortness_of_breath": ["Asthma", "Pneumonia", "Anxiety", "Heart Failure"],
-            "dizziness": ["Vertigo", "Anemia", "Low Blood Pressure", "Dehydration"],
-            "joint_pain": ["Arthritis", "Lupus", "Fibromyalgia", "Injury"]
-        }
+        return SYMPTOM_DISEASE_MAP
     
     def load_diseases_data(self):
         """Load detailed disease information"""
-        return {
-            "Common Cold": {
-                "description": "Viral infection of the upper respiratory tract",
-                "severity": "Mild",
-                "treatment": "Rest, fluids, over-the-counter medications",
-                "image_url": None,
-                "hindi_name": "सर्दी जुकाम",
-                "hindi_description": "ऊपरी श्वसन पथ का वायरल संक्रमण"
-            },
-            "Flu": {
-                "description": "Influenza virus infection affecting respiratory system",
-                "severity": "Moderate",
-                "treatment": "Rest, fluids, antiviral medications if severe",
-                "image_url": None,
-                "hindi_name": "फ्लू",
-                "hindi_description": "श्वसन प्रणाली को प्रभावित करने वाला इन्फ्लूएंजा वायरस संक्रमण"
-            },
-            "COVID-19": {
-                "description": "Coronavirus disease caused by SARS-CoV-2",
-                "severity": "Variable",
-                "treatment": "Rest, isolation, medical care if severe",
-                "image_url": None,
-                "hindi_name": "कोविड-19",
-                "hindi_description": "SARS-CoV-2 के कारण होने वाला कोरोनावायरस रोग"
-            },
-            "Diabetes": {
-                "description": "Metabolic disorder affecting blood sugar regulation",
-                "severity": "Chronic",
-                "treatment": "Diet, exercise, medication, insulin if needed",
-                "image_url": None,
-                "hindi_name": "मधुमेह",
-                "hindi_description": "रक्त शर्करा विनियमन को प्रभावित करने वाला चयापचय विकार"
-            },
-            "Hypertension": {
-                "description": "High blood pressure affecting cardiovascular system",
-                "severity": "Chronic",
-                "treatment": "Lifestyle changes, medication, regular monitoring",
-                "image_url": None,
-                "hindi_name": "उच्च रक्तचाप",
-                "hindi_description": "हृदय प्रणाली को प्रभावित करने वाला उच्च रक्तचाप"
-            }
-        }
+        return DISEASE_INFO
+    
+    def load_or_train_model(self):
+        """Load the trained model from disk, training and saving it if missing or stale"""
+        import joblib
+        import sklearn
+        
+        # One file per scikit-learn version, so an upgrade never unpickles another version's model
+        cache_path = MODEL_CACHE_DIR / f"symptom_models-sklearn-{sklearn.__version__}.joblib"
+        
+        if cache_path.exists():
+            try:
+                cached = joblib.load(cache_path)
+                if (cached["sklearn_version"] == sklearn.__version__
+                        and cached["symptoms_data"] == self.symptoms_data
+                        and cached["params"] == MODEL_PARAMS):
+                    self.probability_table = cached["probability_table"]
+                    return cached["model"]
+            except (OSError, EOFError, pickle.UnpicklingError, KeyError, ValueError):
+                # Unreadable, truncated or older-format cache files are retrained and overwritten
+                pass
+        
+        model = self.train_model()
+        
+        try:
+            MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            joblib.dump({
+                "sklearn_version": sklearn.__version__,
+                "symptoms_data": self.symptoms_data,
+                "params": MODEL_PARAMS,
+                "model": model,
+                "probability_table": self.probability_table
+            }, cache_path, compress=3)
+        except OSError:
+            pass
+        
+        return model
     
     def train_model(self):
         """Train a simple ML model for symptom analysis"""
+        from sklearn.ensemble import RandomForestClassifier
+        
         # Create training data
-        symptoms = []
+        all_symptoms = list(self.symptoms_data.keys())
+        rows = []
         diseases = []
         
-        for symptom, disease_list in self.symptoms_data.items():
+        for index, (symptom, disease_list) in enumerate(self.symptoms_data.items()):
             for disease in disease_list:
-                symptoms.append(symptom)
+                rows.append(index)
                 diseases.append(disease)
         
-        # Create feature matrix
-        symptom_features = pd.get_dummies(symptoms)
+        # Create one-hot feature matrix in the same column order used by analyze_symptoms
+        symptom_features = np.eye(len(all_symptoms), dtype=np.float32)[rows]
         
         # Train model
-        model = RandomForestClassifier(n_estimators=100, random_state=42)
+        model = RandomForestClassifier(**MODEL_PARAMS)
         model.fit(symptom_features, diseases)
         
+        # Features are binary, so score every symptom combination once up front;
+        # row i holds the probabilities for the combination whose bits are set in i
+        patterns = (np.arange(2 ** len(all_symptoms))[:, None] >> np.arange(len(all_symptoms))) & 1
+        self.probability_table = model.predict_proba(patterns.astype(np.float32))
+        
         return model
     
+    def build_symptom_vectors(self):
+        """Fit TF-IDF on the known symptom names and keep the L2-normalized matrix"""
+        from sklearn.preprocessing import normalize
+        
+        symptom_texts = [symptom.replace('_', ' ') for symptom in self.symptoms_data]
+        symptom_vectors = self.vectorizer.fit_transform(symptom_texts)
+        
+        # Terms naming exactly one symptom ("chest", "joint"); shared words like "pain" are not evidence
+        term_counts = np.asarray((symptom_vectors > 0).sum(axis=0)).ravel()
+        self.distinct_terms = np.flatnonzero(term_counts == 1)
+        
+        return normalize(symptom_vectors, norm='l2', copy=False)
+    
+    def transform_queries(self, texts):
+        """TF-IDF transform and L2-normalize a tuple of free-text queries"""
+        from sklearn.preprocessing import normalize
+        
+        return normalize(self.vectorizer.transform([text.lower().replace('_', ' ') for text in texts]))
+    
+    def match_symptom_texts(self, texts, threshold=0.65):
+        """Map free-text symptom descriptions to a known symptom when exactly one clearly matches"""
+        if not texts:
+            return []
+        
+        queries = self.transform_queries(tuple(texts))
+        
+        # Rows are already L2-normalized, so one matrix product gives every cosine similarity
+        similarities = (queries @ self.symptom_vectors.T).toarray()
+        
+        # A symptom only counts when the query shares a term unique to it
+        distinct_overlap = (queries[:, self.distinct_terms] @ self.symptom_vectors[:, self.distinct_terms].T).toarray()
+        similarities[distinct_overlap <= 0] = 0
+        
+        # Accept a single best candidate above the threshold; ties are ambiguous and dropped
+        ranked = np.sort(similarities, axis=1)
+        best = similarities.argmax(axis=1)
+        accepted = (ranked[:, -1] >= threshold) & (ranked[:, -1] > ranked[:, -2])
+        
+        all_symptoms = list(self.symptoms_data.keys())
+        return [all_symptoms[index] for index in best[accepted]]
+    
     def analyze_symptoms(self, selected_symptoms, body_areas=None):
         """Analyze symptoms and predict possible conditions"""
         if not selected_symptoms:
             return []
         
-        # Create feature vector
-        all_symptoms = list(self.symptoms_data.keys())
-        feature_vector = [1 if symptom in selected_symptoms else 0 for symptom in all_symptoms]
+        # Resolve free-text entries to known symptoms in a single batch
+        known = {symptom for symptom in selected_symptoms if symptom in self.symptoms_data}
+        free_text = [symptom for symptom in selected_symptoms if symptom not in self.symptoms_data]
+        selected_symptoms = known.union(self.match_symptom_texts(free_text)) if free_text else known
         
-        # Get predictions
-        predictions = self.model.predict_proba([feature_vector])[0]
+        # Look up precomputed probabilities by the bit pattern of selected symptoms
+        all_symptoms = list(self.symptoms_data.keys())
+        pattern = sum(1 << i for i, symptom in enumerate(all_symptoms) if symptom in selected_symptoms)
+        probabilities = self.probability_table[pattern]
         disease_names = self.model.classes_
         
+        # Only show diseases with >10% confidence, highest first, top 5;
+        # argpartition selects the top 5 without sorting every class
+        top = min(5, len(probabilities))
+        ranked = np.argpartition(-probabilities, top - 1)[:top]
+        ranked = ranked[np.argsort(-probabilities[ranked])]
+        ranked = ranked[probabilities[ranked] > 0.1]
+        
         # Create results with confidence scores
         results = []
-        for disease, confidence in zip(disease_names, predictions):
-            if confidence > 0.1:  # Only show diseases with >10% confidence
-                results.append({
-                    "disease": disease,
-                    "confidence": confidence,
-                    "severity": self.diseases_data.get(disease, {}).get("severity", "Unknown"),
-                    "description": self.diseases_data.get(disease, {}).get("description", "No description available")
-                })
-        
-        # Sort by confidence
-        results.sort(key=lambda x: x["confidence"], reverse=True)
-        return results[:5]  # Return top 5 predictions
+        for index in ranked:
+            disease = disease_names[index]
+            disease_info = self.diseases_data.get(disease, {})
+            results.append({
+                "disease": disease,
+                "confidence": float(probabilities[index]),
+                "severity": disease_info.get("severity", "Unknown"),
+                "description": disease_info.get("description", "No description available")
+            })
+        
+        return results
+
+@st.cache_resource
+def get_symptom_analyzer():
+    """Get the shared symptom analyzer, trained once per process"""
+    return SymptomAnalyzer()
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def analyze_symptoms_cached(selected_symptoms):
+    """Analyze a tuple of symptoms, reusing results across reruns"""
+    return get_symptom_analyzer().analyze_symptoms(list(selected_symptoms))
 
 def main():
     """Main function for AI Symptom Analyzer module"""
@@ -144,8 +273,8 @@ def main():
         st.error("🔒 Please log in to access the Symptom Analyzer")
         return
     
-    # Initialize symptom analyzer
-    analyzer = SymptomAnalyzer()
+    # Shared symptom analyzer (models are read-only and user-independent)
+    analyzer = get_symptom_analyzer()
     
     # Header
     st.markdown("""
@@ -170,7 +299,7 @@ def main():
         # Symptom selection methods
         input_method = st.selectbox(
             "Choose Input Method",
-            ["Manual Selection", "Voice Input", "Body Map Selection"],
+            INPUT_METHODS,
             key="symptom_input_method"
         )
         
@@ -191,8 +320,8 @@ def main():
             # Show selected symptoms
             st.markdown(f"**Selected Symptoms:** {', '.join(selected_symptoms)}")
             
-            # Get predictions
-            predictions = analyzer.analyze_symptoms(selected_symptoms, body_areas)
+            # Get predictions; the same symptoms in any order share one cached analysis
+            predictions = analyze_symptoms_cached(tuple(sorted(set(selected_symptoms))))
             
             if predictions:
                 display_predictions(predictions, language)
@@ -230,9 +359,11 @@ def main():
             col1, col2 = st.columns([1, 2])
             
             with col1:
-                st.markdown(f"**{disease_name}**")
-                st.write(f"Confidence: {prediction['confidence']*100:.1f}%")
-                st.write(f"Severity: {prediction['severity']}")
+                st.markdown(
+                    f"**{disease_name}**\n\n"
+                    f"| Confidence | Severity |\n|---|---|\n"
+                    f"| {prediction['confidence']*100:.1f}% | {prediction['severity']} |"
+                )
             
             with col2:
                 image_url = create_image_url_input(
@@ -312,38 +443,23 @@ def body_map_selection(analyzer, language):
     # Body area selection
     body_areas = st.multiselect(
         "Select affected body areas:",
-        ["Head", "Chest", "Abdomen", "Arms", "Legs", "Back"],
+        BODY_AREAS,
         help="Select areas where you're experiencing symptoms"
     )
     
     # Symptom selection based on body areas
     selected_symptoms = []
     
-    if "Head" in body_areas:
-        head_symptoms = st.multiselect(
-            "Head symptoms:",
-            ["headache", "dizziness", "fever"]
-        )
-        selected_symptoms.extend(head_symptoms)
-    
-    if "Chest" in body_areas:
-        chest_symptoms = st.multiselect(
-            "Chest symptoms:",
-            ["chest_pain", "shortness_of_breath", "cough"]
-        )
-        selected_symptoms.extend(chest_symptoms)
-    
-    if "Abdomen" in body_areas:
-        abdomen_symptoms = st.multiselect(
-            "Abdomen symptoms:",
-            ["abdominal_pain", "nausea", "fatigue"]
-        )
-        selected_symptoms.extend(abdomen_symptoms)
+    for area, area_symptoms in BODY_AREA_SYMPTOMS.items():
+        if area in body_areas:
+            selected_symptoms.extend(st.multiselect(f"{area} symptoms:", area_symptoms))
     
     return selected_symptoms, body_areas
 
 def display_predictions(predictions, language):
     """Display AI predictions with confidence scores"""
+    import plotly.graph_objects as go
+    
     st.markdown("#### 🤖 AI Analysis Results")
     
     for i, prediction in enumerate(predictions):
@@ -353,7 +469,7 @@ def display_predictions(predictions, language):
         description = prediction['description']
         
         # Get disease info
-        disease_info = analyzer.diseases_data.get(disease_name, {})
+        disease_info = DISEASE_INFO.get(disease_name, {})
         
         # Create prediction card
         with st.expander(f"🏥 {disease_name} ({confidence*100:.1f}% confidence)"):
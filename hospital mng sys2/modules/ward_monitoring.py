@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 import pandas as pd
 import numpy as np
+from collections import Counter
 from datetime import datetime, timedelta
 import plotly.express as px
 
@@ -12,9 +13,21 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.auth import check_authentication
 from utils.database import db
-from utils.ui_components import create_metric_card, create_alert_box, create_progress_bar
+from utils.ui_components import create_metric_card, create_metric_cards, create_alert_box, create_alert_boxes, create_progress_bar
 from config.themes import get_theme_css
 
+# Alert severity ranks (most severe first) and their alert box types
+ALERT_SEVERITY_RANK = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
+ALERT_SEVERITY_TYPES = {
+    'Critical': 'error',
+    'High': 'warning',
+    'Medium': 'info',
+    'Low': 'success'
+}
+
+# Shared generator for simulated ward data
+RNG = np.random.default_rng()
+
 class SmartWardMonitoring:
     def __init__(self):
         self.ward_types = {
@@ -28,20 +41,10 @@ class SmartWardMonitoring:
         self.patient_statuses = ["Stable", "Critical", "Recovering", "Under Observation"]
     
     def get_ward_occupancy(self):
-        """Get current ward occupancy data"""
-        occupancy_data = []
-        
-        for ward_name, ward_info in self.ward_types.items():
-            occupancy_rate = (ward_info['occupied'] / ward_info['capacity']) * 100
-            available_beds = ward_info['capacity'] - ward_info['occupied']
-            
-            occupancy_data.append({
-                'ward': ward_name,
-                'capacity': ward_info['capacity'],
-                'occupied': ward_info['occupied'],
-                'available': available_beds,
-                'occupancy_rate': occupancy_rate
-            })
+        """Get current ward occupancy data as a DataFrame with one row per ward"""
+        occupancy_data = pd.DataFrame.from_dict(self.ward_types, orient='index').rename_axis('ward').reset_index()
+        occupancy_data['available'] = occupancy_data['capacity'] - occupancy_data['occupied']
+        occupancy_data['occupancy_rate'] = (occupancy_data['occupied'] / occupancy_data['capacity'] * 100).round(1)
         
         return occupancy_data
     
@@ -57,12 +60,12 @@ class SmartWardMonitoring:
                 'id': f"patient_{ward_name.lower().replace(' ', '_')}_{i+1}",
                 'name': f"Patient {i+1}",
                 'bed_number': f"Bed {i+1:02d}",
-                'status': np.random.choice(self.patient_statuses),
-                'heart_rate': np.random.randint(60, 120),
-                'blood_pressure': f"{np.random.randint(110, 140)}/{np.random.randint(70, 90)}",
-                'temperature': round(np.random.uniform(36.5, 38.5), 1),
-                'oxygen_saturation': np.random.randint(95, 100),
-                'last_updated': (datetime.now() - timedelta(minutes=np.random.randint(1, 60))).strftime("%H:%M")
+                'status': RNG.choice(self.patient_statuses),
+                'heart_rate': int(RNG.integers(60, 120)),
+                'blood_pressure': f"{int(RNG.integers(110, 140))}/{int(RNG.integers(70, 90))}",
+                'temperature': round(RNG.uniform(36.5, 38.5), 1),
+                'oxygen_saturation': int(RNG.integers(95, 100)),
+                'last_updated': (datetime.now() - timedelta(minutes=int(RNG.integers(1, 60)))).strftime("%H:%M")
             }
             
             # Add alerts for critical patients
@@ -81,12 +84,12 @@ class SmartWardMonitoring:
         """Get analytics data for a specific ward"""
         # Simulate analytics data
         analytics = {
-            'average_stay_duration': np.random.uniform(3, 7),
-            'readmission_rate': np.random.uniform(5, 15),
-            'patient_satisfaction': np.random.uniform(4.0, 5.0),
-            'staff_efficiency': np.random.uniform(85, 95),
-            'infection_rate': np.random.uniform(0, 2),
-            'discharge_rate': np.random.uniform(80, 95)
+            'average_stay_duration': RNG.uniform(3, 7),
+            'readmission_rate': RNG.uniform(5, 15),
+            'patient_satisfaction': RNG.uniform(4.0, 5.0),
+            'staff_efficiency': RNG.uniform(85, 95),
+            'infection_rate': RNG.uniform(0, 2),
+            'discharge_rate': RNG.uniform(80, 95)
         }
         
         return analytics
@@ -105,14 +108,14 @@ class SmartWardMonitoring:
             "Bed availability low"
         ]
         
-        num_alerts = np.random.randint(0, 4)
+        num_alerts = int(RNG.integers(0, 4))
         
         for i in range(num_alerts):
             alert = {
                 'id': f"alert_{i+1}",
-                'type': np.random.choice(alert_types),
-                'severity': np.random.choice(['Low', 'Medium', 'High', 'Critical']),
-                'timestamp': (datetime.now() - timedelta(minutes=np.random.randint(1, 120))).strftime("%H:%M"),
+                'type': RNG.choice(alert_types),
+                'severity': RNG.choice(['Low', 'Medium', 'High', 'Critical']),
+                'timestamp': (datetime.now() - timedelta(minutes=int(RNG.integers(1, 120)))).strftime("%H:%M"),
                 'status': 'Active'
             }
             alerts.append(alert)
@@ -131,14 +134,30 @@ class SmartWardMonitoring:
             staff_member = {
                 'id': f"staff_{i+1}",
                 'name': f"Staff Member {i+1}",
-                'role': np.random.choice(staff_roles),
-                'status': np.random.choice(['On Duty', 'On Break', 'Off Duty']),
-                'patients_assigned': np.random.randint(1, 5)
+                'role': RNG.choice(staff_roles),
+                'status': RNG.choice(['On Duty', 'On Break', 'Off Duty']),
+                'patients_assigned': int(RNG.integers(1, 5))
             }
             staff.append(staff_member)
         
         return staff
 
+@st.cache_data
+def build_occupancy_chart(occupancy_rows):
+    """Build the stacked bed occupancy chart from (ward, occupied, available) rows"""
+    occupancy_data = pd.DataFrame(occupancy_rows, columns=['ward', 'occupied', 'available'])
+    
+    fig = px.bar(
+        occupancy_data,
+        x='ward',
+        y=['occupied', 'available'],
+        title=f"Bed Occupancy by Ward",
+        barmode='stack',
+        color_discrete_map={'occupied': '#ff6b6b', 'available': '#51cf66'},
+        height=400
+    )
+    return fig
+
 def main():
     """Main function for Smart Ward Monitoring module"""
     
@@ -164,24 +183,18 @@ def main():
     # Overall hospital statistics
     st.markdown("### 📊 Hospital Overview")
     
-    total_capacity = sum(ward['capacity'] for ward in ward_monitoring.ward_types.values())
-    total_occupied = sum(ward['occupied'] for ward in ward_monitoring.ward_types.values())
+    occupancy_data = ward_monitoring.get_ward_occupancy()
+    total_capacity = int(occupancy_data['capacity'].sum())
+    total_occupied = int(occupancy_data['occupied'].sum())
     total_available = total_capacity - total_occupied
     overall_occupancy = (total_occupied / total_capacity) * 100
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        create_metric_card("Total Beds", total_capacity, "🛏️")
-    
-    with col2:
-        create_metric_card("Occupied Beds", total_occupied, "👥")
-    
-    with col3:
-        create_metric_card("Available Beds", total_available, "✅")
-    
-    with col4:
-        create_metric_card("Occupancy Rate", f"{overall_occupancy:.1f}%", "📊")
+    create_metric_cards([
+        ("Total Beds", total_capacity, "🛏️"),
+        ("Occupied Beds", total_occupied, "👥"),
+        ("Available Beds", total_available, "✅"),
+        ("Occupancy Rate", f"{overall_occupancy:.1f}%", "📊")
+    ])
     
     # Main tabs
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -222,37 +235,25 @@ def main():
             # Occupancy visualization
             st.markdown("#### 📊 Occupancy Visualization")
             
-            occupancy_data = ward_monitoring.get_ward_occupancy()
+            # Create occupancy chart (cached per occupancy snapshot)
+            fig = build_occupancy_chart(tuple(
+                occupancy_data[['ward', 'occupied', 'available']].itertuples(index=False, name=None)
+            ))
+            st.plotly_chart(fig, use_container_width=True, key="bed_occupancy_chart")
             
-            # Create occupancy chart
-            fig = px.bar(
-                occupancy_data,
-                x='ward',
-                y=['occupied', 'available'],
-                title=f"Bed Occupancy by Ward",
-                barmode='stack',
-                color_discrete_map={'occupied': '#ff6b6b', 'available': '#51cf66'}
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            # All wards in one table
+            ward_table = occupancy_data.assign(
+                status=np.where(occupancy_data['available'] > 0, '✅ Available', '❌ Full')
+            ).set_axis(["Ward", "Total Beds", "Occupied", "Available", "Occupancy %", "Status"], axis=1)
+            st.dataframe(ward_table, use_container_width=True, hide_index=True)
             
             # Staff assignment
             st.markdown("#### 👨‍⚕️ Staff Assignment")
             
             if staff:
-                staff_data = []
-                for member in staff:
-                    staff_data.append([
-                        member['name'],
-                        member['role'],
-                        member['status'],
-                        member['patients_assigned']
-                    ])
-                
-                staff_df = pd.DataFrame(
-                    staff_data,
-                    columns=["Name", "Role", "Status", "Patients Assigned"]
-                )
+                staff_df = pd.DataFrame.from_records(
+                    staff, columns=['name', 'role', 'status', 'patients_assigned']
+                ).set_axis(["Name", "Role", "Status", "Patients Assigned"], axis=1)
                 st.dataframe(staff_df, use_container_width=True)
             else:
                 st.info("No staff data available for this ward.")
@@ -272,10 +273,7 @@ def main():
                 st.markdown(f"#### 📊 {selected_ward_monitoring} - Patient Status")
                 
                 # Status summary
-                status_counts = {}
-                for patient in patients:
-                    status = patient['status']
-                    status_counts[status] = status_counts.get(status, 0) + 1
+                status_counts = Counter(patient['status'] for patient in patients)
                 
                 col1, col2, col3, col4 = st.columns(4)
                 
@@ -295,26 +293,36 @@ def main():
                 st.markdown("#### 📋 Patient Details")
                 
                 for patient in patients:
-                    with st.expander(f"🛏️ {patient['bed_number']} - {patient['name']} ({patient['status']})"):
+                    # Expanders build their content even when collapsed, so only
+                    # render a patient's panel once it has been opened; the label leaves out the
+                    # simulated status, which changes every rerun and would reset the widget
+                    if not st.checkbox(f"🛏️ {patient['bed_number']} - {patient['name']}",
+                                       key=f"show_{patient['id']}"):
+                        continue
+                    
+                    with st.container():
                         col1, col2 = st.columns(2)
                         
                         with col1:
-                            st.markdown(f"**Patient ID:** {patient['id']}")
-                            st.markdown(f"**Bed Number:** {patient['bed_number']}")
-                            st.markdown(f"**Status:** {patient['status']}")
-                            st.markdown(f"**Last Updated:** {patient['last_updated']}")
+                            st.markdown(
+                                f"**Patient ID:** {patient['id']}\n\n"
+                                f"**Bed Number:** {patient['bed_number']}\n\n"
+                                f"**Status:** {patient['status']}\n\n"
+                                f"**Last Updated:** {patient['last_updated']}"
+                            )
                         
                         with col2:
-                            st.markdown(f"**Heart Rate:** {patient['heart_rate']} bpm")
-                            st.markdown(f"**Blood Pressure:** {patient['blood_pressure']} mmHg")
-                            st.markdown(f"**Temperature:** {patient['temperature']}°C")
-                            st.markdown(f"**Oxygen Saturation:** {patient['oxygen_saturation']}%")
+                            st.markdown(
+                                f"**Heart Rate:** {patient['heart_rate']} bpm\n\n"
+                                f"**Blood Pressure:** {patient['blood_pressure']} mmHg\n\n"
+                                f"**Temperature:** {patient['temperature']}°C\n\n"
+                                f"**Oxygen Saturation:** {patient['oxygen_saturation']}%"
+                            )
                         
                         # Alerts
                         if patient['alerts']:
                             st.markdown("**🚨 Alerts:**")
-                            for alert in patient['alerts']:
-                                create_alert_box(alert, "warning")
+                            create_alert_boxes([(alert, "warning") for alert in patient['alerts']])
                         
                         # Action buttons
                         col1, col2, col3 = st.columns(3)
@@ -349,10 +357,11 @@ def main():
             # Alert statistics
             st.markdown("#### 📊 Alert Overview")
             
-            critical_alerts = len([a for a in all_alerts if a['severity'] == 'Critical'])
-            high_alerts = len([a for a in all_alerts if a['severity'] == 'High'])
-            medium_alerts = len([a for a in all_alerts if a['severity'] == 'Medium'])
-            low_alerts = len([a for a in all_alerts if a['severity'] == 'Low'])
+            severity_counts = Counter(a['severity'] for a in all_alerts)
+            critical_alerts = severity_counts['Critical']
+            high_alerts = severity_counts['High']
+            medium_alerts = severity_counts['Medium']
+            low_alerts = severity_counts['Low']
             
             col1, col2, col3, col4 = st.columns(4)
             
@@ -372,19 +381,11 @@ def main():
             st.markdown("#### 🚨 Active Alerts")
             
             # Sort alerts by severity
-            severity_order = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
-            sorted_alerts = sorted(all_alerts, key=lambda x: severity_order[x['severity']])
+            sorted_alerts = sorted(all_alerts, key=lambda x: ALERT_SEVERITY_RANK[x['severity']])
             
             for alert in sorted_alerts:
-                severity_color = {
-                    'Critical': 'error',
-                    'High': 'warning',
-                    'Medium': 'info',
-                    'Low': 'success'
-                }
-                
                 alert_message = f"**{alert['ward']}:** {alert['type']}"
-                create_alert_box(alert_message, severity_color[alert['severity']])
+                create_alert_box(alert_message, ALERT_SEVERITY_TYPES[alert['severity']])
                 
                 col1, col2, col3 = st.columns([2, 1, 1])
                 
@@ -466,17 +467,17 @@ def main():
                 performance_data,
                 x='Metric',
                 y='Value',
-                title=f"{selected_ward_analytics} Performance Metrics"
+                title=f"{selected_ward_analytics} Performance Metrics",
+                height=400
             )
-            fig.update_layout(height=400)
             st.plotly_chart(fig, use_container_width=True)
             
             # Trend analysis
             st.markdown("#### 📊 Trend Analysis")
             
             # Simulate trend data
-            dates = [(datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(30, 0, -1)]
-            occupancy_trend = [np.random.uniform(70, 95) for _ in dates]
+            dates = pd.date_range(end=datetime.now() - timedelta(days=1), periods=30).strftime("%Y-%m-%d")
+            occupancy_trend = RNG.uniform(70, 95, len(dates))
             
             trend_data = pd.DataFrame({
                 'Date': dates,
@@ -487,9 +488,9 @@ def main():
                 trend_data,
                 x='Date',
                 y='Occupancy Rate (%)',
-                title=f"{selected_ward_analytics} - 30-Day Occupancy Trend"
+                title=f"{selected_ward_analytics} - 30-Day Occupancy Trend",
+                height=300
             )
-            fig2.update_layout(height=300)
             st.plotly_chart(fig2, use_container_width=True)
             
             # Export options
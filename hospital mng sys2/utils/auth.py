@@ -172,6 +172,11 @@ class BiometricAuth:
         """Get current user role"""
         return st.session_state.get('role')
 
+@st.cache_resource
+def get_biometric_auth():
+    """Get the shared authenticator, loading the user store once per process"""
+    return BiometricAuth()
+
 def create_login_form():
     """Create login form with multiple authentication methods"""
     st.markdown("""
@@ -181,7 +186,7 @@ def create_login_form():
     </div>
     """, unsafe_allow_html=True)
     
-    auth = BiometricAuth()
+    auth = get_biometric_auth()
     
     # Authentication method selection
     auth_method = st.selectbox(
@@ -20,7 +20,7 @@ class DataManager:
         
         # Add timestamp and ensure required fields
         data['timestamp'] = datetime.now().isoformat()
-        data['id'] = len(existing_data) + 1
+        data['id'] = self.next_id(existing_data)
         
         # Ensure patient_name exists
         if 'patient_name' not in data or not data['patient_name']:
@@ -33,8 +33,13 @@ class DataManager:
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(existing_data, f, indent=2, ensure_ascii=False)
         
+        load_cached_data.clear()
         return data['id']
     
+    def next_id(self, records):
+        """Get the next integer id, one past the highest id in use"""
+        return max((item.get('id', 0) for item in records), default=0) + 1
+    
     def load_data(self, data_type):
         """Load data from JSON file with error handling"""
         file_path = self.data_dir / f"{data_type}.json"
@@ -75,6 +80,8 @@ class DataManager:
         file_path = self.data_dir / f"{data_type}.json"
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        
+        load_cached_data.clear()
     
     def clear_all_data(self):
         """Clear all data files"""
@@ -83,6 +90,13 @@ class DataManager:
                 file_path.unlink()
             except:
                 pass
+        
+        load_cached_data.clear()
 
 # Global data manager instance
 data_manager = DataManager()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_cached_data(data_type):
+    """Load records for display, reused across reruns until the data changes"""
+    return data_manager.load_data(data_type)
@@ -1,6 +1,7 @@
 import streamlit as st
 import json
 import os
+import sys
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -20,6 +21,7 @@ class HospitalDatabase:
         """Load all data from JSON files"""
         self.patients = self.load_json("patients.json", self.get_default_patients())
         self.doctors = self.load_json("doctors.json", self.get_default_doctors())
+        self.intern_fields(self.doctors, ("specialization", "status"))
         self.appointments = self.load_json("appointments.json", self.get_default_appointments())
         self.prescriptions = self.load_json("prescriptions.json", self.get_default_prescriptions())
         self.lab_reports = self.load_json("lab_reports.json", self.get_default_lab_reports())
@@ -27,6 +29,13 @@ class HospitalDatabase:
         self.emergency_alerts = self.load_json("emergency_alerts.json", [])
         self.ward_data = self.load_json("ward_data.json", self.get_default_ward_data())
     
+    def intern_fields(self, records, fields):
+        """Intern repeated string fields so lookups and comparisons hit the identity fast path"""
+        for record in records:
+            for field in fields:
+                if isinstance(record.get(field), str):
+                    record[field] = sys.intern(record[field])
+    
     def load_json(self, filename, default_data):
         """Load JSON file or create with default data"""
         filepath = os.path.join(self.data_dir, filename)
@@ -271,14 +280,12 @@ class HospitalDatabase:
     
     def search_patients(self, query):
         """Search patients by name or ID"""
-        results = []
         query = query.lower()
-        for patient in self.patients:
-            if (query in patient["name"].lower() or 
-                query in patient["id"].lower() or
-                query in patient["phone"]):
-                results.append(patient)
-        return results
+        # Fields are joined with a separator that never occurs in a query, so one scan covers all three
+        return [
+            patient for patient in self.patients
+            if query in f"{patient['name']}\x00{patient['id']}\x00{patient['phone']}".lower()
+        ]
     
     # Doctor operations
     def get_doctors_by_specialization(self, specialization):
@@ -303,6 +310,10 @@ class HospitalDatabase:
         """Get appointments for a patient"""
         return [apt for apt in self.appointments if apt["patient_id"] == patient_id]
     
+    def get_appointment_dates(self):
+        """Get the set of dates that have at least one appointment"""
+        return {apt["date"] for apt in self.appointments}
+    
     def update_appointment_status(self, appointment_id, status):
         """Update appointment status"""
         for appointment in self.appointments:
@@ -383,13 +394,14 @@ class HospitalDatabase:
     # Analytics and reporting
     def get_statistics(self):
         """Get hospital statistics"""
+        today = datetime.now().strftime("%Y-%m-%d")
         return {
             "total_patients": len(self.patients),
-            "active_patients": len([p for p in self.patients if p["status"] == "Active"]),
+            "active_patients": sum(1 for p in self.patients if p["status"] == "Active"),
             "total_doctors": len(self.doctors),
-            "available_doctors": len([d for d in self.doctors if d["status"] == "Available"]),
+            "available_doctors": sum(1 for d in self.doctors if d["status"] == "Available"),
             "total_appointments": len(self.appointments),
-            "today_appointments": len([a for a in self.appointments if a["date"] == datetime.now().strftime("%Y-%m-%d")]),
+            "today_appointments": sum(1 for a in self.appointments if a["date"] == today),
             "active_emergencies": len(self.get_active_emergency_alerts()),
             "occupied_beds": sum(1 for ward in self.ward_data.values() 
                                for bed in ward.values() if bed.get("occupied", False))
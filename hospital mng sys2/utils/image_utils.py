@@ -7,22 +7,57 @@ import base64
 import os
 from urllib.parse import urlparse
 import hashlib
+import threading
+from collections import OrderedDict
+
+# ITU-R 601 luma weights PIL uses when converting RGB to grayscale
+GRAYSCALE_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# Most decoded images and successfully validated URLs kept in memory, least recently used evicted first
+MAX_LOADED_IMAGES = 32
+MAX_VALIDATED_URLS = 128
 
 class ImageProcessor:
     def __init__(self):
         self.cache_dir = "assets/images/cache"
         self.ensure_cache_directory()
+        
+        # Decoded images by URL, so reruns skip the disk read and decode
+        self.loaded_images = OrderedDict()
+        # URLs already confirmed to serve images; failed checks are not remembered and are retried
+        self.valid_image_urls = OrderedDict()
+        # The processor is shared by every session thread
+        self.cache_lock = threading.Lock()
+    
+    def remember(self, cache, key, value, max_size):
+        """Store a value in a bounded LRU cache, evicting the least recently used entry"""
+        with self.cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+    
+    def recall(self, cache, key):
+        """Return a value from a bounded LRU cache and mark it recently used, or None if absent"""
+        with self.cache_lock:
+            if key not in cache:
+                return None
+            cache.move_to_end(key)
+            return cache[key]
     
     def ensure_cache_directory(self):
         """Ensure cache directory exists"""
         os.makedirs(self.cache_dir, exist_ok=True)
     
     def download_image(self, url, timeout=10):
-        """Download image from URL with error handling"""
+        """Download image from URL with error handling, caching the raw bytes"""
         try:
             response = requests.get(url, timeout=timeout)
             response.raise_for_status()
-            return Image.open(io.BytesIO(response.content))
+            image = Image.open(io.BytesIO(response.content))
+            image.load()
+            self.cache_image_bytes(url, response.content, image)
+            return image
         except requests.exceptions.RequestException as e:
             st.error(f"Error downloading image: {e}")
             return None
@@ -32,6 +67,9 @@ class ImageProcessor:
     
     def validate_image_url(self, url):
         """Validate if URL is a valid image URL"""
+        if self.recall(self.valid_image_urls, url):
+            return True
+        
         try:
             parsed = urlparse(url)
             if not parsed.scheme or not parsed.netloc:
@@ -40,33 +78,46 @@ class ImageProcessor:
             # Check if URL points to an image
             response = requests.head(url, timeout=5)
             content_type = response.headers.get('content-type', '')
-            return content_type.startswith('image/')
+            is_image = content_type.startswith('image/')
         except:
             return False
+        
+        if is_image:
+            self.remember(self.valid_image_urls, url, True, MAX_VALIDATED_URLS)
+        return is_image
     
     def get_cached_image_path(self, url):
         """Get cached image path for URL"""
         url_hash = hashlib.md5(url.encode()).hexdigest()
         return os.path.join(self.cache_dir, f"{url_hash}.jpg")
     
-    def cache_image(self, url, image):
-        """Cache downloaded image"""
+    def cache_image_bytes(self, url, data, image):
+        """Cache downloaded image bytes as-is, without decoding and re-encoding them"""
+        self.remember(self.loaded_images, url, image, MAX_LOADED_IMAGES)
         try:
             cache_path = self.get_cached_image_path(url)
-            image.save(cache_path, "JPEG", quality=85)
+            with open(cache_path, "wb") as f:
+                f.write(data)
             return cache_path
-        except Exception as e:
+        except OSError as e:
             st.warning(f"Could not cache image: {e}")
             return None
     
     def get_cached_image(self, url):
         """Get cached image if available"""
+        image = self.recall(self.loaded_images, url)
+        if image is not None:
+            return image
+        
         cache_path = self.get_cached_image_path(url)
         if os.path.exists(cache_path):
             try:
-                return Image.open(cache_path)
+                image = Image.open(cache_path)
+                image.load()
             except:
                 return None
+            self.remember(self.loaded_images, url, image, MAX_LOADED_IMAGES)
+            return image
         return None
     
     def process_image(self, image, filters=None):
@@ -74,22 +125,36 @@ class ImageProcessor:
         if filters is None:
             return image
         
-        processed = image.copy()
+        processed = self.adjust_brightness_contrast(
+            image, filters.get("brightness", 1.0), filters.get("contrast", 1.0)
+        )
         
-        for filter_name, params in filters.items():
-            if filter_name == "brightness":
-                enhancer = ImageEnhance.Brightness(processed)
-                processed = enhancer.enhance(params)
-            elif filter_name == "contrast":
-                enhancer = ImageEnhance.Contrast(processed)
-                processed = enhancer.enhance(params)
-            elif filter_name == "blur":
-                processed = processed.filter(ImageFilter.GaussianBlur(params))
-            elif filter_name == "sharpen":
-                processed = processed.filter(ImageFilter.UnsharpMask(params))
+        # A zero radius leaves the image unchanged, so skip the filter pass
+        if filters.get("blur"):
+            processed = processed.filter(ImageFilter.GaussianBlur(filters["blur"]))
+        if filters.get("sharpen"):
+            processed = processed.filter(ImageFilter.UnsharpMask(filters["sharpen"]))
         
         return processed
     
+    def adjust_brightness_contrast(self, image, brightness=1.0, contrast=1.0):
+        """Apply brightness then contrast to the whole pixel array in one NumPy pass"""
+        if brightness == 1.0 and contrast == 1.0:
+            return image
+        
+        if image.mode not in ("RGB", "L"):
+            image = ImageEnhance.Brightness(image).enhance(brightness)
+            return ImageEnhance.Contrast(image).enhance(contrast)
+        
+        pixels = np.clip(np.asarray(image, dtype=np.float32) * brightness, 0, 255)
+        
+        # Contrast blends towards the mean grayscale level, as ImageEnhance.Contrast does
+        gray = pixels @ GRAYSCALE_WEIGHTS if image.mode == "RGB" else pixels
+        mean = int(gray.mean() + 0.5)
+        pixels = mean + contrast * (pixels - mean)
+        
+        return Image.fromarray(np.clip(pixels + 0.5, 0, 255).astype(np.uint8), image.mode)
+    
     def resize_image(self, image, max_size=(800, 600)):
         """Resize image while maintaining aspect ratio"""
         image.thumbnail(max_size, Image.Resampling.LANCZOS)
@@ -130,10 +195,9 @@ def display_image_from_url(image_url, title="Image", width=300):
         if cached_image:
             st.image(cached_image, caption=title, width=width)
         else:
-            # Download and cache image
+            # Download image; its bytes are cached as downloaded
             image = image_processor.download_image(image_url)
             if image:
-                image_processor.cache_image(image_url, image)
                 st.image(image, caption=title, width=width)
             else:
                 st.error("Could not load image")
@@ -225,8 +289,9 @@ def create_image_upload_widget():
     
     if uploaded_file is not None:
         try:
-            image = Image.open(uploaded_file)
-            st.image(image, caption="Uploaded Image", use_column_width=True)
+            # Work on a display-sized copy; thumbnail lets JPEG decode at reduced scale
+            image = image_processor.resize_image(Image.open(uploaded_file))
+            st.image(image, caption="Uploaded Image", use_container_width=True)
             
             # Image processing options
             st.markdown("#### 🔧 Image Processing")
@@ -250,7 +315,7 @@ def create_image_upload_widget():
                 }
                 
                 processed_image = image_processor.process_image(image, filters)
-                st.image(processed_image, caption="Processed Image", use_column_width=True)
+                st.image(processed_image, caption="Processed Image", use_container_width=True)
         
         except Exception as e:
             st.error(f"Error processing uploaded image: {e}")
@@ -5,6 +5,15 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import streamlit as st
 
+# Estimated wait in minutes and queue order for each token priority
+PRIORITY_WAIT_MINUTES = {
+    "Emergency": 5,
+    "High": 15,
+    "Normal": 30,
+    "Low": 45
+}
+PRIORITY_RANK = {"Emergency": 0, "High": 1, "Normal": 2, "Low": 3}
+
 class TokenManager:
     def __init__(self):
         self.data_dir = Path("data")
@@ -20,13 +29,7 @@ class TokenManager:
         token_id = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
         
         # Calculate estimated wait time based on priority
-        wait_times = {
-            "Emergency": 5,
-            "High": 15,
-            "Normal": 30,
-            "Low": 45
-        }
-        estimated_wait = wait_times.get(priority, 30)
+        estimated_wait = PRIORITY_WAIT_MINUTES.get(priority, 30)
         
         token_data = {
             "token_id": token_id,
@@ -80,8 +83,7 @@ class TokenManager:
             waiting_tokens = [t for t in waiting_tokens if t.get('department') == department]
         
         # Sort by priority and creation time
-        priority_order = {"Emergency": 0, "High": 1, "Normal": 2, "Low": 3}
-        waiting_tokens.sort(key=lambda x: (priority_order.get(x.get('priority', 'Normal'), 2), x.get('created_at', '')))
+        waiting_tokens.sort(key=lambda x: (PRIORITY_RANK.get(x.get('priority', 'Normal'), 2), x.get('created_at', '')))
         
         return waiting_tokens
     
@@ -115,14 +117,14 @@ class TokenManager:
         
         stats = {
             "total_tokens": len(tokens),
-            "waiting": len([t for t in tokens if t.get('status') == 'Waiting']),
-            "called": len([t for t in tokens if t.get('status') == 'Called']),
-            "completed": len([t for t in tokens if t.get('status') == 'Completed']),
+            "waiting": 0,
+            "called": 0,
+            "completed": 0,
             "departments": {},
             "avg_wait_time": 0
         }
         
-        # Calculate department stats
+        # Count overall and per-department statuses in a single pass
         for token in tokens:
             dept = token.get('department', 'Unknown')
             if dept not in stats['departments']:
@@ -132,8 +134,9 @@ class TokenManager:
                     "completed": 0
                 }
             
-            status = token.get('status', 'Waiting')
+            status = token.get('status', 'Waiting').lower()
             if status in stats['departments'][dept]:
+                stats[status] += 1
                 stats['departments'][dept][status] += 1
         
         return stats
@@ -1,13 +1,25 @@
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import qrcode
-from PIL import Image
 import io
 import base64
+from functools import lru_cache
+
+# Alert box colors and icons by alert type
+ALERT_COLORS = {
+    "info": "#3498db",
+    "success": "#2ecc71",
+    "warning": "#f39c12",
+    "error": "#e74c3c"
+}
+
+ALERT_ICONS = {
+    "info": "ℹ️",
+    "success": "✅",
+    "warning": "⚠️",
+    "error": "❌"
+}
 
 def create_glow_button(text, key=None, on_click=None):
     """Create a glowing button with futuristic design"""
@@ -18,20 +30,32 @@ def create_glow_button(text, key=None, on_click=None):
         help="Click to proceed"
     )
 
+@lru_cache(maxsize=512)
+def metric_card_html(title, value, delta=None, delta_color="normal"):
+    """Build the HTML for a metric card, reusing the markup for repeated cards"""
+    # Kept on one unindented line so joined cards stay one HTML block instead of indented code
+    delta_html = f'<p style="color: {"green" if delta_color == "normal" else "red"}">{delta}</p>' if delta else ''
+    return f'<div class="metric-card"><h3>{title}</h3><h2>{value}</h2>{delta_html}</div>'
+
 def create_metric_card(title, value, delta=None, delta_color="normal"):
     """Create a metric card with animated design"""
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>{title}</h3>
-            <h2>{value}</h2>
-            {f'<p style="color: {"green" if delta_color == "normal" else "red"}">{delta}</p>' if delta else ''}
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(metric_card_html(title, value, delta, delta_color), unsafe_allow_html=True)
+
+def create_metric_cards(cards):
+    """Render (title, value, delta) tuples as a row of metric cards in a single markdown call"""
+    st.markdown(
+        f'<div style="display: grid; grid-template-columns: repeat({len(cards)}, 1fr); gap: 8px;">'
+        + "".join(metric_card_html(*card) for card in cards)
+        + "</div>",
+        unsafe_allow_html=True
+    )
 
 def create_animated_chart(data, chart_type="line", title="Chart"):
     """Create animated charts with Plotly"""
+    import plotly.express as px
+    
     if chart_type == "line":
         fig = px.line(data, x=data.index, y=data.values, title=title)
     elif chart_type == "bar":
@@ -49,7 +73,7 @@ def create_animated_chart(data, chart_type="line", title="Chart"):
     return fig
 
 def create_vital_signs_chart():
-    """Create real-time vital signs chart"""
+    """Create real-time vital signs chart with WebGL traces"""
     # Simulate real-time data
     time_points = pd.date_range(start=datetime.now() - timedelta(minutes=30), 
                                end=datetime.now(), freq='1min')
@@ -58,9 +82,10 @@ def create_vital_signs_chart():
     oxygen_sat = np.random.normal(98, 2, len(time_points))
     temperature = np.random.normal(37, 0.5, len(time_points))
     
+    import plotly.graph_objects as go
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=time_points,
         y=heart_rate,
         name='Heart Rate (BPM)',
@@ -68,7 +93,7 @@ def create_vital_signs_chart():
         fill='tonexty'
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=time_points,
         y=oxygen_sat,
         name='Oxygen Saturation (%)',
@@ -76,7 +101,7 @@ def create_vital_signs_chart():
         yaxis='y2'
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=time_points,
         y=temperature,
         name='Temperature (°C)',
@@ -97,17 +122,23 @@ def create_vital_signs_chart():
     
     return fig
 
+@lru_cache(maxsize=128)
 def create_qr_code(data, size=200):
     """Create QR code for prescriptions, payments, etc."""
+    import qrcode
+    
     qr = qrcode.QRCode(version=1, box_size=10, border=5)
     qr.add_data(data)
     qr.make(fit=True)
     
+    # Render at roughly the display size instead of encoding a larger image the browser scales down
+    qr.box_size = max(1, size // (qr.modules_count + 2 * qr.border))
     img = qr.make_image(fill_color="black", back_color="white")
     
     # Convert to base64 for display
+    # Fast zlib level: the PNG is only inlined for on-screen display
     buffered = io.BytesIO()
-    img.save(buffered, format="PNG")
+    img.save(buffered, format="PNG", compress_level=1)
     img_str = base64.b64encode(buffered.getvalue()).decode()
     
     return img_str
@@ -137,29 +168,25 @@ def create_progress_bar(value, max_value, title="Progress"):
     </div>
     """, unsafe_allow_html=True)
 
-def create_alert_box(message, alert_type="info"):
-    """Create styled alert boxes"""
-    colors = {
-        "info": "#3498db",
-        "success": "#2ecc71",
-        "warning": "#f39c12",
-        "error": "#e74c3c"
-    }
-    
-    icons = {
-        "info": "ℹ️",
-        "success": "✅",
-        "warning": "⚠️",
-        "error": "❌"
-    }
-    
-    st.markdown(f"""
-    <div style="background: {colors[alert_type]}; color: white; padding: 1rem; 
+@lru_cache(maxsize=512)
+def alert_box_html(message, alert_type="info"):
+    """Build the HTML for a styled alert box, reusing the markup for repeated alerts"""
+    return f"""
+    <div style="background: {ALERT_COLORS[alert_type]}; color: white; padding: 1rem; 
                 border-radius: 10px; margin: 1rem 0; display: flex; align-items: center;">
-        <span style="font-size: 1.5rem; margin-right: 1rem;">{icons[alert_type]}</span>
+        <span style="font-size: 1.5rem; margin-right: 1rem;">{ALERT_ICONS[alert_type]}</span>
         <span>{message}</span>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def create_alert_box(message, alert_type="info"):
+    """Create styled alert boxes"""
+    st.markdown(alert_box_html(message, alert_type), unsafe_allow_html=True)
+
+def create_alert_boxes(alerts):
+    """Render (message, alert_type) pairs as alert boxes in a single markdown call"""
+    st.markdown("".join(alert_box_html(message, alert_type) for message, alert_type in alerts),
+                unsafe_allow_html=True)
 
 def create_body_map():
     """Create interactive body map for symptom selection"""
@@ -219,6 +246,7 @@ def create_image_display(image_url, title="Image", width=300):
 
 def create_timeline_chart(data):
     """Create timeline chart for medical history"""
+    import plotly.graph_objects as go
     fig = go.Figure()
     
     for i, (date, event, category) in enumerate(data):
@@ -245,6 +273,7 @@ def create_timeline_chart(data):
 
 def create_radar_chart(categories, values, title="Health Metrics"):
     """Create radar chart for health metrics"""
+    import plotly.graph_objects as go
     fig = go.Figure()
     
     fig.add_trace(go.Scatterpolar(
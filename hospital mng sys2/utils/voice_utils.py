@@ -4,6 +4,27 @@ import time
 import queue
 import numpy as np
 
+# Spoken command handlers for each voice command system, built once at import
+VOICE_COMMANDS = {
+    "help": lambda: st.info("Available commands: help, status, emergency"),
+    "status": lambda: st.info("System status: All systems operational"),
+    "emergency": lambda: st.warning("🚨 Emergency mode activated!")
+}
+
+VOICE_NAVIGATION_COMMANDS = {
+    "home": lambda: st.info("🏠 Navigating to home..."),
+    "dashboard": lambda: st.info("📊 Opening dashboard..."),
+    "settings": lambda: st.info("⚙️ Opening settings..."),
+    "help": lambda: st.info("❓ Opening help...")
+}
+
+VOICE_HEALTH_COMMANDS = {
+    "check vitals": lambda: st.info("📊 Checking vital signs..."),
+    "schedule appointment": lambda: st.info("📅 Opening appointment scheduler..."),
+    "emergency": lambda: st.warning("🚨 Emergency services activated!"),
+    "medication": lambda: st.info("💊 Opening medication tracker...")
+}
+
 class VoiceAssistant:
     def __init__(self):
         self.audio_queue = queue.Queue()
@@ -112,14 +133,8 @@ def create_voice_command_system():
     """Create a voice command system"""
     st.markdown("### 🎤 Voice Commands")
     
-    commands = {
-        "help": lambda: st.info("Available commands: help, status, emergency"),
-        "status": lambda: st.info("System status: All systems operational"),
-        "emergency": lambda: st.warning("🚨 Emergency mode activated!")
-    }
-    
     if st.button("🎤 Start Voice Commands"):
-        voice_assistant.voice_command_processor(commands)
+        voice_assistant.voice_command_processor(VOICE_COMMANDS)
 
 def create_multilingual_voice_system():
     """Create a multilingual voice system"""
@@ -135,15 +150,8 @@ def create_voice_navigation():
     """Create voice navigation"""
     st.markdown("### 🧭 Voice Navigation")
     
-    navigation_commands = {
-        "home": lambda: st.info("🏠 Navigating to home..."),
-        "dashboard": lambda: st.info("📊 Opening dashboard..."),
-        "settings": lambda: st.info("⚙️ Opening settings..."),
-        "help": lambda: st.info("❓ Opening help...")
-    }
-    
     if st.button("🎤 Voice Navigation"):
-        voice_assistant.voice_command_processor(navigation_commands)
+        voice_assistant.voice_command_processor(VOICE_NAVIGATION_COMMANDS)
 
 def create_voice_reminder_system():
     """Create voice reminder system"""
@@ -160,15 +168,8 @@ def create_voice_health_assistant():
     """Create voice health assistant"""
     st.markdown("### 🏥 Voice Health Assistant")
     
-    health_commands = {
-        "check vitals": lambda: st.info("📊 Checking vital signs..."),
-        "schedule appointment": lambda: st.info("📅 Opening appointment scheduler..."),
-        "emergency": lambda: st.warning("🚨 Emergency services activated!"),
-        "medication": lambda: st.info("💊 Opening medication tracker...")
-    }
-    
     if st.button("🎤 Health Assistant"):
-        voice_assistant.voice_command_processor(health_commands)
+        voice_assistant.voice_command_processor(VOICE_HEALTH_COMMANDS)
 
 def create_voice_emergency_system():
     """Create voice emergency system"""